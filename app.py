@@ -12,60 +12,86 @@ import asyncio
 from dotenv import load_dotenv
 import logging
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (once per process, even across hot reloads)
+if not globals().get("_DOTENV_LOADED"):
+    load_dotenv()
+    _DOTENV_LOADED = True
 
 # Add the current directory to Python path for imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+if _APP_DIR not in sys.path:
+    sys.path.append(_APP_DIR)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging once for the whole process: a single stdout handler with
+# plain messages, replacing any handler an imported module may have installed
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+    force=True
+)
 logger = logging.getLogger(__name__)
 
 async def main():
     """Main application entry point for Gradio deployment."""
-    print("⚡ Starting beep-boop...")
-    print("🔧 Initializing async OpenAI SDK interface...")
+    logger.info("⚡ Starting beep-boop...\n🔧 Initializing async OpenAI SDK interface...")
     
     try:
         # Import core components
         from modules.core import AsyncConversationOrchestrator
         from modules.cypherpunk_ui import CypherpunkInterface
+        from modules.digi_core_integration import check_digi_core_health_async
         
         # Initialize the async orchestrator
-        print("🔄 Loading async conversation orchestrator...")
-        orchestrator = AsyncConversationOrchestrator(
+        logger.info("🔄 Loading async conversation orchestrator...")
+        orchestrator = await asyncio.to_thread(
+            AsyncConversationOrchestrator,
             model="gpt-4o-mini",
             rag_backend="auto",
             enable_evaluation=True,
             enable_memory=True
         )
         
-        # Initialize knowledge base (Digi-Core or YAML fallback)
-        print("📚 Loading knowledge matrix...")
+        # Load knowledge base (Digi-Core or YAML fallback), probe Digi-Core and
+        # build the interface concurrently
+        logger.info("📚 Loading knowledge matrix...\n🎯 Creating neural interface...")
+        kb_initialized, health, interface = await asyncio.gather(
+            orchestrator.initialize_knowledge_base_async(),
+            check_digi_core_health_async(),
+            asyncio.to_thread(CypherpunkInterface, orchestrator)
+        )
         
-        kb_initialized = orchestrator.initialize_knowledge_base()
         if not kb_initialized:
-            print("⚠️ Knowledge base initialization had issues, but continuing...")
+            logger.warning("⚠️ Knowledge base initialization had issues, but continuing...")
         else:
-            print("✅ Knowledge base loaded successfully!")
+            logger.info("✅ Knowledge base loaded successfully!")
         
-        # Create and launch cypherpunk interface
-        print("🎯 Creating neural interface...")
-        interface = CypherpunkInterface(orchestrator)
+        if health.get('health_check_passed'):
+            logger.info("🧠 Digi-Core is healthy")
+        elif health.get('error'):
+            logger.info(f"ℹ️ Digi-Core unavailable: {health['error']}")
         
-        print("🚀 Launching beep-boop...")
+        logger.info("🚀 Launching beep-boop...")
         interface.launch(share=False, debug=False)  # No sharing for deployment
         
     except ImportError as e:
-        print(f"❌ Import error: {e}")
-        print("🔧 Please ensure all dependencies are installed:")
-        print("   pip install -r requirements.txt")
+        logger.error(f"❌ Import error: {e}\n"
+                     "🔧 Please ensure all dependencies are installed:\n"
+                     "   pip install -r requirements.txt")
         return 1
     except Exception as e:
-        print(f"❌ Error: {e}")
-        print("🔧 Please check your environment and try again")
+        logger.error(f"❌ Error: {e}\n"
+                     "🔧 Please check your environment and try again")
         return 1
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    # Prefer uvloop's event loop where it is installed (not available on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -5,11 +5,231 @@
 
 import yaml
 import os
+import re
+import sys
+import pickle
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import partial
+from itertools import chain, product, repeat
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, List, Set, Tuple
+from typing import Callable, Dict, Any, Iterable, List, Optional, Set, Tuple
 import logging
 from data_loader import DataManager
 
+# libyaml's C loader and dumper are several times faster than the pure-Python ones
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    logging.getLogger(__name__).warning("libyaml not available, using the pure-Python YAML loader and dumper")
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+# Output options for data files, bound once so the append and rewrite paths format identically
+_dump_yaml = partial(yaml.dump, Dumper=YamlDumper, default_flow_style=False, sort_keys=False,
+                     allow_unicode=True, width=1000)
+
+# Aho-Corasick scans for all keywords in one C pass; the regex matcher is the fallback
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Keyword families for the theme-based connections
+FREEDOM_KEYWORDS = ('freedom', 'autonomy', 'independence', 'sovereignty', 'liberty')
+INNOVATION_KEYWORDS = ('innovation', 'creativity', 'novel', 'breakthrough', 'inventive', 'creative')
+
+# Theme connections by pattern name: (connection type, relevance score, description, keywords)
+THEME_CONNECTIONS = {
+    'freedom': ('freedom_autonomy', 0.9,
+                "Freedom/autonomy theme connects {source_file} to {target_file}", FREEDOM_KEYWORDS),
+    'innovation': ('innovation_creativity', 0.85,
+                   "Innovation/creativity theme connects {source_file} to {target_file}", INNOVATION_KEYWORDS)
+}
+
+# Per-file parse cache of the integrator, kept inside the data directory it describes
+PARSE_CACHE_FILE = ".parse_cache.pkl"
+
+# Below this many files, process start-up costs more than a parallel keyword scan saves
+PARALLEL_SCAN_MIN_FILES = 256
+
+# Field holding the shared keyword, for connection types that record one
+CONNECTION_DETAIL_FIELDS = {
+    'technical_skill': 'skill',
+    'project_reference': 'project',
+    'personality_trait': 'trait',
+    'core_value': 'value'
+}
+
+@dataclass(frozen=True, slots=True)
+class Connection:
+    """
+    A cross-reference between two data files.
+    
+    Slotted and frozen: connection lists can be large, and instances are
+    hashable so identical connections deduplicate through a set. ``detail``
+    holds the shared keyword for connection types that record one.
+    """
+    source_category: str
+    source_file: str
+    target_category: str
+    target_file: str
+    connection_type: str
+    relevance_score: float
+    description: str
+    detail: Optional[str] = None
+    
+    @property
+    def detail_field(self) -> Optional[str]:
+        """Name the detail is stored under in YAML references, e.g. 'skill'."""
+        return CONNECTION_DETAIL_FIELDS.get(self.connection_type)
+
+
+class KeywordMatcher:
+    """
+    Finds which of a list of keywords occur in a text in one pass.
+    
+    With pyahocorasick installed, the keywords are built into an
+    Aho-Corasick automaton that reports every occurrence, overlapping ones
+    included, in a single linear scan in C. Otherwise they are compiled into
+    a single lookahead alternation, longest first, so the scan tries every
+    position of the text once instead of running one substring search per
+    keyword; keywords that are prefixes of a longer match at the same
+    position are credited through a precomputed prefix mask. Either way the
+    result equals testing ``keyword in text`` for each.
+    """
+    
+    def __init__(self, keywords: Tuple[str, ...]):
+        self.always = 0
+        by_keyword: Dict[str, int] = {}
+        for index, keyword in enumerate(keywords):
+            if keyword:
+                by_keyword[keyword] = by_keyword.get(keyword, 0) | 1 << index
+            else:
+                # The empty string is in every text
+                self.always |= 1 << index
+        self.full = self.always
+        for bits in by_keyword.values():
+            self.full |= bits
+        
+        self._automaton = None
+        self._pattern = None
+        if by_keyword and ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, bits in by_keyword.items():
+                self._automaton.add_word(keyword, bits)
+            self._automaton.make_automaton()
+        elif by_keyword:
+            # Bits for each keyword plus every keyword that is a prefix of it
+            self._prefix_masks = {}
+            for keyword in by_keyword:
+                bits = 0
+                for other, other_bits in by_keyword.items():
+                    if keyword.startswith(other):
+                        bits |= other_bits
+                self._prefix_masks[keyword] = bits
+            
+            ordered = sorted(by_keyword, key=len, reverse=True)
+            self._pattern = re.compile('(?=(' + '|'.join(map(re.escape, ordered)) + '))')
+    
+    def mask(self, text: str) -> int:
+        """Bitset with bit i set when keyword i occurs in text."""
+        mask = self.always
+        if self._automaton is not None:
+            for _, bits in self._automaton.iter(text):
+                mask |= bits
+                if mask == self.full:
+                    break
+        elif self._pattern is not None:
+            prefix_masks = self._prefix_masks
+            for match in self._pattern.finditer(text):
+                mask |= prefix_masks[match.group(1)]
+                if mask == self.full:
+                    break
+        return mask
+
+
+def _scan_texts(keywords: Tuple[str, ...], texts: List[str]) -> List[int]:
+    """Keyword bitsets for a shard of texts; runs in a worker process."""
+    matcher = KeywordMatcher(keywords)
+    return [matcher.mask(text) for text in texts]
+
+
+class CachedDataManager(DataManager):
+    """
+    DataManager that reuses parsed YAML across runs.
+    
+    Parsed files are kept in a pickle inside data_dir, keyed by path and
+    validated against each file's mtime and size, so files unchanged since
+    the last run skip YAML parsing entirely. Unlike the whole-cache
+    snapshot, which any write invalidates, a run that rewrites a few files
+    only drops those files' entries.
+    """
+    
+    # Bumped whenever what DataManager._load_yaml_file returns changes shape
+    CACHE_FORMAT = 2
+    
+    def __init__(self, data_dir: str = "data", cache_file: str = PARSE_CACHE_FILE,
+                 cache_enabled: bool = True):
+        # A relative name is resolved inside data_dir, like DataManager's snapshot
+        self.cache_file = Path(data_dir) / cache_file
+        self._parsed = self._read_parsed_cache()
+        self._dirty = False
+        super().__init__(data_dir, cache_enabled)
+        self.save()
+    
+    def _read_parsed_cache(self) -> Dict[str, Tuple[Tuple[int, int], Any]]:
+        """Load the persisted parse cache, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.cache_file, 'rb') as file:
+                cached = pickle.load(file)
+            if not isinstance(cached, dict) or cached.get('format') != self.CACHE_FORMAT:
+                return {}
+            return cached['parsed']
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Ignoring unreadable parse cache {self.cache_file}: {e}")
+            return {}
+    
+    def _load_yaml_file(self, file_path: Path) -> Dict[str, Any]:
+        """Load a YAML file, reusing the cached parse if the file is unchanged."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return super()._load_yaml_file(file_path)
+        
+        key = str(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        entry = self._parsed.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        
+        data = super()._load_yaml_file(file_path)
+        self._parsed[key] = (signature, data)
+        self._dirty = True
+        return data
+    
+    def invalidate(self, file_path: Path) -> None:
+        """Forget the cached parse of a file that has been rewritten."""
+        if self._parsed.pop(str(file_path), None) is not None:
+            self._dirty = True
+    
+    def save(self) -> None:
+        """Persist the parse cache if it changed, replacing the file atomically."""
+        if not self._dirty:
+            return
+        tmp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+        try:
+            with open(tmp_file, 'wb') as file:
+                pickle.dump({'format': self.CACHE_FORMAT, 'parsed': self._parsed}, file,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
+            self._dirty = False
+        except Exception as e:
+            self.logger.warning(f"Could not save parse cache {self.cache_file}: {e}")
+
+
 class CrossReferenceIntegrator:
     """
     Integrates cross-references across the modular data structure to improve
@@ -19,9 +239,57 @@ class CrossReferenceIntegrator:
     
     def __init__(self, data_dir: str = "data"):
         self.data_dir = Path(data_dir)
-        self.data_manager = DataManager(data_dir)
+        self.data_manager = CachedDataManager(data_dir)
         self.logger = logging.getLogger(__name__)
         
+        # Every theme's keywords form one family, so a file is scanned once for
+        # all themes and each theme selects its own keywords' bits
+        self._theme_keywords: Tuple[str, ...] = ()
+        self._theme_bits: Dict[str, int] = {}
+        for theme, (_, _, _, keywords) in THEME_CONNECTIONS.items():
+            self._theme_bits[theme] = ((1 << len(keywords)) - 1) << len(self._theme_keywords)
+            self._theme_keywords += keywords
+        
+        # Data-derived keyword families by connection type, with their collectors
+        self._family_collectors: Dict[str, Callable[[], List[str]]] = {
+            'technical_skill': self._collect_technical_skills,
+            'project_reference': self._collect_project_names,
+            'personality_trait': self._collect_personality_traits,
+            'core_value': self._collect_core_values
+        }
+        
+        # Connection finders keyed by pattern name; other pattern names
+        # produce no connections
+        self._pattern_finders = {
+            **{theme: partial(self._find_theme_connections, theme) for theme in THEME_CONNECTIONS},
+            'technical_skills': self._find_technical_connections,
+            'projects': self._find_project_connections,
+            'personality_traits': self._find_personality_connections,
+            'values': self._find_value_connections
+        }
+        
+        # Data-derived family each finder scans; theme finders all scan _theme_keywords
+        self._finder_families: Dict[Callable, str] = {
+            self._find_technical_connections: 'technical_skill',
+            self._find_project_connections: 'project_reference',
+            self._find_personality_connections: 'personality_trait',
+            self._find_value_connections: 'core_value'
+        }
+        
+        # Category contents fetched from the data manager, reset on each identification run
+        self._category_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Lowercased text per (category, file), reset on each identification run
+        self._lower_cache: Dict[Tuple[str, str], str] = {}
+        
+        # Keyword-hit bitsets per keyword family and (category, file), per run
+        self._mask_cache: Dict[Any, Dict[Tuple[str, str], int]] = {}
+        self._matchers: Dict[Tuple[str, ...], KeywordMatcher] = {}
+        
+        # Data-derived keyword families (skills, projects, ...), per run
+        self._families: Dict[str, Tuple[str, ...]] = {}
+        self._keyword_files_cache: Dict[Tuple[Tuple[str, ...], str], Tuple[int, Dict[int, List[str]]]] = {}
+        
         # Define cross-reference patterns
         self.cross_reference_patterns = {
             'values': {
@@ -67,8 +335,32 @@ class CrossReferenceIntegrator:
                 'personality': ['work_style', 'professional_relationships']
             }
         }
+        
+        self.rebuild_pattern_plan()
+    
+    def rebuild_pattern_plan(self) -> None:
+        """
+        Resolve cross_reference_patterns into the flat plan identification runs.
+        
+        Each category pair becomes one (report key, source category, target
+        category, finders) entry, with pattern names already resolved to
+        their finders and names without one dropped. Call this again after
+        changing cross_reference_patterns.
+        """
+        self._pattern_plan: List[Tuple[str, str, str, Tuple[Callable, ...]]] = []
+        for source_category, target_categories in self.cross_reference_patterns.items():
+            for target_category, patterns in target_categories.items():
+                finders = []
+                for pattern in patterns:
+                    finder = self._pattern_finders.get(pattern)
+                    if finder is not None and finder not in finders:
+                        finders.append(finder)
+                self._pattern_plan.append((
+                    f"{source_category}_to_{target_category}",
+                    source_category, target_category, tuple(finders)
+                ))
     
-    def identify_cross_references(self) -> Dict[str, List[Dict[str, Any]]]:
+    def identify_cross_references(self) -> Dict[str, List[Connection]]:
         """
         Identify potential cross-references across all data categories.
         
@@ -76,373 +368,571 @@ class CrossReferenceIntegrator:
             Dictionary mapping category pairs to lists of cross-references
         """
         cross_references = {}
+        seen: Set[Connection] = set()
+        self._category_cache.clear()
+        self._lower_cache.clear()
+        self._mask_cache.clear()
+        self._matchers.clear()
+        self._families.clear()
+        self._keyword_files_cache.clear()
         
         # Load all data
         all_data = {}
         for category in self.cross_reference_patterns.keys():
-            all_data[category] = self.data_manager.get_category(category)
+            all_data[category] = self._category_data(category)
+        
+        # Build each file's lowercased leaf text once, up front, for every finder
+        for category, files in all_data.items():
+            for file_name, content in files.items():
+                self._lower_cache[(category, file_name)] = self._flatten_data(content).lower()
+        
+        if len(self._lower_cache) >= PARALLEL_SCAN_MIN_FILES:
+            # Pre-scan only for finders that will run: planned, with files on both sides
+            live_finders = dict.fromkeys(
+                finder for _, source_category, target_category, finders in self._pattern_plan
+                if all_data.get(source_category) and all_data.get(target_category) for finder in finders
+            )
+            if live_finders:
+                self._scan_families_parallel(live_finders)
         
         # Identify cross-references for each category pair
-        for source_category, target_categories in self.cross_reference_patterns.items():
-            for target_category, patterns in target_categories.items():
-                key = f"{source_category}_to_{target_category}"
-                cross_references[key] = []
-                
-                source_data = all_data.get(source_category, {})
-                target_data = all_data.get(target_category, {})
-                
-                # Find cross-references based on patterns
-                for pattern in patterns:
-                    refs = self._find_pattern_matches(
-                        source_data, target_data, pattern, source_category, target_category
-                    )
-                    cross_references[key].extend(refs)
+        for key, source_category, target_category, finders in self._pattern_plan:
+            connections = cross_references[key] = []
+            
+            # Only patterns with a finder can produce connections, and none can
+            # when either side has no files
+            source_data = all_data.get(source_category, {})
+            target_data = all_data.get(target_category, {})
+            if not (finders and source_data and target_data):
+                continue
+            for finder in finders:
+                # A keyword listed twice in its family rediscovers the same link;
+                # keep the first so files are not rewritten with duplicates
+                for connection in finder(source_data, target_data, source_category, target_category):
+                    if connection not in seen:
+                        seen.add(connection)
+                        connections.append(connection)
         
         return cross_references
     
+    def _scan_families_parallel(self, finders: Iterable[Callable], max_workers: Optional[int] = None) -> None:
+        """
+        Fill the keyword bitsets of the given finders' families for every file on a process pool.
+        
+        Keyword scanning holds the GIL, so for large data directories the
+        files are sharded across spawn-context worker processes, one map per
+        family. Finders then find every bitset already memoized. On failure
+        the bitsets are simply computed lazily in this process.
+        """
+        keys = list(self._lower_cache)
+        texts = [self._lower_cache[key] for key in keys]
+        families = [self._keyword_family(self._finder_families[finder]) if finder in self._finder_families
+                    else self._theme_keywords for finder in finders]
+        workers = max_workers or os.cpu_count() or 1
+        shard_size = -(-len(texts) // (workers * 4))
+        shards = [texts[i:i + shard_size] for i in range(0, len(texts), shard_size)]
+        
+        try:
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                for family in dict.fromkeys(families):
+                    if not family:
+                        continue
+                    masks = self._mask_cache.setdefault(family, {})
+                    scanned = chain.from_iterable(pool.map(_scan_texts, repeat(family), shards))
+                    masks.update(zip(keys, scanned))
+        except Exception as e:
+            self.logger.warning(f"Parallel keyword scan failed ({e}), scanning sequentially")
+    
     def _find_pattern_matches(self, source_data: Dict, target_data: Dict, 
-                            pattern: str, source_category: str, target_category: str) -> List[Dict[str, Any]]:
+                            pattern: str, source_category: str, target_category: str) -> List[Connection]:
         """Find matches for a specific pattern between source and target data."""
-        matches = []
-        
-        # Convert data to searchable text
-        source_text = self._flatten_data(source_data)
-        target_text = self._flatten_data(target_data)
-        
-        # Find semantic matches based on pattern
-        if pattern == 'freedom':
-            matches.extend(self._find_freedom_connections(source_data, target_data, source_category, target_category))
-        elif pattern == 'innovation':
-            matches.extend(self._find_innovation_connections(source_data, target_data, source_category, target_category))
-        elif pattern == 'technical_skills':
-            matches.extend(self._find_technical_connections(source_data, target_data, source_category, target_category))
-        elif pattern == 'projects':
-            matches.extend(self._find_project_connections(source_data, target_data, source_category, target_category))
-        elif pattern == 'personality_traits':
-            matches.extend(self._find_personality_connections(source_data, target_data, source_category, target_category))
-        elif pattern == 'values':
-            matches.extend(self._find_value_connections(source_data, target_data, source_category, target_category))
-        
-        return matches
-    
-    def _find_freedom_connections(self, source_data: Dict, target_data: Dict, 
-                                source_category: str, target_category: str) -> List[Dict[str, Any]]:
-        """Find connections related to freedom and autonomy."""
-        connections = []
-        
-        # Look for freedom-related content in source
-        freedom_keywords = ['freedom', 'autonomy', 'independence', 'sovereignty', 'liberty']
-        
-        for source_file, source_content in source_data.items():
-            source_text = str(source_content).lower()
-            if any(keyword in source_text for keyword in freedom_keywords):
-                # Find related content in target
-                for target_file, target_content in target_data.items():
-                    target_text = str(target_content).lower()
-                    if any(keyword in target_text for keyword in freedom_keywords):
-                        connections.append({
-                            'source_category': source_category,
-                            'source_file': source_file,
-                            'target_category': target_category,
-                            'target_file': target_file,
-                            'connection_type': 'freedom_autonomy',
-                            'relevance_score': 0.9,
-                            'description': f"Freedom/autonomy theme connects {source_file} to {target_file}"
-                        })
-        
-        return connections
-    
-    def _find_innovation_connections(self, source_data: Dict, target_data: Dict,
-                                   source_category: str, target_category: str) -> List[Dict[str, Any]]:
-        """Find connections related to innovation and creativity."""
-        connections = []
-        
-        innovation_keywords = ['innovation', 'creativity', 'novel', 'breakthrough', 'inventive', 'creative']
-        
-        for source_file, source_content in source_data.items():
-            source_text = str(source_content).lower()
-            if any(keyword in source_text for keyword in innovation_keywords):
-                for target_file, target_content in target_data.items():
-                    target_text = str(target_content).lower()
-                    if any(keyword in target_text for keyword in innovation_keywords):
-                        connections.append({
-                            'source_category': source_category,
-                            'source_file': source_file,
-                            'target_category': target_category,
-                            'target_file': target_file,
-                            'connection_type': 'innovation_creativity',
-                            'relevance_score': 0.85,
-                            'description': f"Innovation/creativity theme connects {source_file} to {target_file}"
-                        })
-        
-        return connections
+        finder = self._pattern_finders.get(pattern)
+        if finder is None:
+            return []
+        return finder(source_data, target_data, source_category, target_category)
+    
+    def _find_theme_connections(self, theme: str, source_data: Dict, target_data: Dict,
+                                source_category: str, target_category: str) -> List[Connection]:
+        """Find connections between files that both touch a theme from THEME_CONNECTIONS."""
+        connection_type, relevance_score, description, _ = THEME_CONNECTIONS[theme]
+        return self._find_by_keywords(
+            source_data, target_data, source_category, target_category,
+            self._theme_keywords, connection_type, relevance_score, description,
+            theme_bits=self._theme_bits[theme]
+        )
     
     def _find_technical_connections(self, source_data: Dict, target_data: Dict,
-                                  source_category: str, target_category: str) -> List[Dict[str, Any]]:
+                                  source_category: str, target_category: str) -> List[Connection]:
         """Find connections related to technical skills and technologies."""
-        connections = []
-        
-        # Get technical skills from technical_skills data
-        tech_skills = []
-        if 'technical_skills' in self.data_manager.cache:
-            tech_data = self.data_manager.cache['technical_skills']
-            for file_name, content in tech_data.items():
-                if 'programming_languages' in content:
-                    for lang in content['programming_languages']:
-                        if isinstance(lang, dict) and 'language' in lang:
-                            tech_skills.append(lang['language'].lower())
-                        elif isinstance(lang, str):
-                            tech_skills.append(lang.lower())
-        
-        # Find technical connections
-        for source_file, source_content in source_data.items():
-            source_text = str(source_content).lower()
-            for skill in tech_skills:
-                if skill in source_text:
-                    for target_file, target_content in target_data.items():
-                        target_text = str(target_content).lower()
-                        if skill in target_text:
-                            connections.append({
-                                'source_category': source_category,
-                                'source_file': source_file,
-                                'target_category': target_category,
-                                'target_file': target_file,
-                                'connection_type': 'technical_skill',
-                                'skill': skill,
-                                'relevance_score': 0.95,
-                                'description': f"Technical skill '{skill}' connects {source_file} to {target_file}"
-                            })
-        
-        return connections
+        return self._find_by_keywords(
+            source_data, target_data, source_category, target_category,
+            self._keyword_family('technical_skill'),
+            'technical_skill', 0.95,
+            "Technical skill '{keyword}' connects {source_file} to {target_file}",
+            detail_field='skill'
+        )
     
     def _find_project_connections(self, source_data: Dict, target_data: Dict,
-                                source_category: str, target_category: str) -> List[Dict[str, Any]]:
+                                source_category: str, target_category: str) -> List[Connection]:
         """Find connections related to specific projects."""
-        connections = []
-        
-        # Get project names from projects data
-        project_names = []
-        if 'projects' in self.data_manager.cache:
-            projects_data = self.data_manager.cache['projects']
-            for file_name, content in projects_data.items():
-                if 'features' in content:
-                    for feature in content['features']:
-                        if isinstance(feature, dict) and 'project' in feature:
-                            project_names.append(feature['project'].lower())
-        
-        # Find project connections
-        for source_file, source_content in source_data.items():
-            source_text = str(source_content).lower()
-            for project in project_names:
-                if project in source_text:
-                    for target_file, target_content in target_data.items():
-                        target_text = str(target_content).lower()
-                        if project in target_text:
-                            connections.append({
-                                'source_category': source_category,
-                                'source_file': source_file,
-                                'target_category': target_category,
-                                'target_file': target_file,
-                                'connection_type': 'project_reference',
-                                'project': project,
-                                'relevance_score': 0.9,
-                                'description': f"Project '{project}' connects {source_file} to {target_file}"
-                            })
-        
-        return connections
+        return self._find_by_keywords(
+            source_data, target_data, source_category, target_category,
+            self._keyword_family('project_reference'),
+            'project_reference', 0.9,
+            "Project '{keyword}' connects {source_file} to {target_file}",
+            detail_field='project'
+        )
     
     def _find_personality_connections(self, source_data: Dict, target_data: Dict,
-                                    source_category: str, target_category: str) -> List[Dict[str, Any]]:
+                                    source_category: str, target_category: str) -> List[Connection]:
         """Find connections related to personality traits."""
-        connections = []
-        
-        # Get personality traits from personality data
-        personality_traits = []
-        if 'personal' in self.data_manager.cache:
-            personality_data = self.data_manager.cache['personal']
-            if 'personality' in personality_data:
-                personality_content = personality_data['personality']
-                if 'traits' in personality_content:
-                    for trait in personality_content['traits']:
-                        if isinstance(trait, dict) and 'trait' in trait:
-                            personality_traits.append(trait['trait'].lower())
-        
-        # Find personality connections
-        for source_file, source_content in source_data.items():
-            source_text = str(source_content).lower()
-            for trait in personality_traits:
-                if trait in source_text:
-                    for target_file, target_content in target_data.items():
-                        target_text = str(target_content).lower()
-                        if trait in target_text:
-                            connections.append({
-                                'source_category': source_category,
-                                'source_file': source_file,
-                                'target_category': target_category,
-                                'target_file': target_file,
-                                'connection_type': 'personality_trait',
-                                'trait': trait,
-                                'relevance_score': 0.8,
-                                'description': f"Personality trait '{trait}' connects {source_file} to {target_file}"
-                            })
-        
-        return connections
+        return self._find_by_keywords(
+            source_data, target_data, source_category, target_category,
+            self._keyword_family('personality_trait'),
+            'personality_trait', 0.8,
+            "Personality trait '{keyword}' connects {source_file} to {target_file}",
+            detail_field='trait'
+        )
     
     def _find_value_connections(self, source_data: Dict, target_data: Dict,
-                              source_category: str, target_category: str) -> List[Dict[str, Any]]:
+                              source_category: str, target_category: str) -> List[Connection]:
         """Find connections related to core values."""
-        connections = []
+        return self._find_by_keywords(
+            source_data, target_data, source_category, target_category,
+            self._keyword_family('core_value'),
+            'core_value', 0.85,
+            "Core value '{keyword}' connects {source_file} to {target_file}",
+            detail_field='value'
+        )
+    
+    def _keyword_family(self, name: str) -> Tuple[str, ...]:
+        """
+        Get a data-derived keyword family, collecting it once per identification run.
         
-        # Get core values from values data
+        Returning the same tuple for every category pair also lets the
+        family's compiled KeywordMatcher and hit bitsets be reused.
+        """
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = tuple(self._family_collectors[name]())
+        return family
+    
+    def _category_data(self, category: str) -> Dict[str, Any]:
+        """Get a category's files from the data manager, once per identification run."""
+        data = self._category_cache.get(category)
+        if data is None:
+            data = self._category_cache[category] = self.data_manager.get_category(category)
+        return data
+    
+    def _collect_technical_skills(self) -> List[str]:
+        """Get technical skills from technical_skills data."""
+        tech_skills = []
+        for file_name, content in self._category_data('technical_skills').items():
+            if 'programming_languages' in content:
+                for lang in content['programming_languages']:
+                    if isinstance(lang, dict) and 'language' in lang:
+                        tech_skills.append(lang['language'].lower())
+                    elif isinstance(lang, str):
+                        tech_skills.append(lang.lower())
+        return tech_skills
+    
+    def _collect_project_names(self) -> List[str]:
+        """Get project names from projects data."""
+        project_names = []
+        for file_name, content in self._category_data('projects').items():
+            if 'features' in content:
+                for feature in content['features']:
+                    if isinstance(feature, dict) and 'project' in feature:
+                        project_names.append(feature['project'].lower())
+        return project_names
+    
+    def _collect_personality_traits(self) -> List[str]:
+        """Get personality traits from personality data."""
+        personality_traits = []
+        personality_data = self._category_data('personal')
+        if 'personality' in personality_data:
+            personality_content = personality_data['personality']
+            if 'traits' in personality_content:
+                for trait in personality_content['traits']:
+                    if isinstance(trait, dict) and 'trait' in trait:
+                        personality_traits.append(trait['trait'].lower())
+        return personality_traits
+    
+    def _collect_core_values(self) -> List[str]:
+        """Get core values from values data."""
         core_values = []
-        if 'personal' in self.data_manager.cache:
-            values_data = self.data_manager.cache['personal']
-            if 'values' in values_data:
-                values_content = values_data['values']
-                if 'core_values' in values_content:
-                    for value in values_content['core_values']:
-                        if isinstance(value, dict) and 'value' in value:
-                            core_values.append(value['value'].lower())
-        
-        # Find value connections
-        for source_file, source_content in source_data.items():
-            source_text = str(source_content).lower()
-            for value in core_values:
-                if value in source_text:
-                    for target_file, target_content in target_data.items():
-                        target_text = str(target_content).lower()
-                        if value in target_text:
-                            connections.append({
-                                'source_category': source_category,
-                                'source_file': source_file,
-                                'target_category': target_category,
-                                'target_file': target_file,
-                                'connection_type': 'core_value',
-                                'value': value,
-                                'relevance_score': 0.85,
-                                'description': f"Core value '{value}' connects {source_file} to {target_file}"
-                            })
-        
-        return connections
-    
-    def _flatten_data(self, data: Dict) -> str:
-        """Flatten nested data structure into searchable text."""
-        if isinstance(data, dict):
-            return ' '.join(str(v) for v in data.values())
-        elif isinstance(data, list):
-            return ' '.join(str(item) for item in data)
-        else:
-            return str(data)
+        values_data = self._category_data('personal')
+        if 'values' in values_data:
+            values_content = values_data['values']
+            if 'core_values' in values_content:
+                for value in values_content['core_values']:
+                    if isinstance(value, dict) and 'value' in value:
+                        core_values.append(value['value'].lower())
+        return core_values
+    
+    def _find_by_keywords(self, source_data: Dict, target_data: Dict,
+                          source_category: str, target_category: str,
+                          keywords: Tuple[str, ...], connection_type: str, relevance_score: float,
+                          description: str, detail_field: Optional[str] = None,
+                          theme_bits: int = 0) -> List[Connection]:
+        """
+        Connect source and target files that share keywords.
+        
+        With no detail_field, each pair of files that both contain any of the
+        keywords selected by theme_bits is connected once. Otherwise every
+        keyword a pair shares gives its own connection, with the keyword as
+        its detail (stored under detail_field in the YAML references).
+        
+        Each file is scanned once per keyword family per identification run
+        into a bitset of the keywords it contains (see _keyword_mask), so a
+        file appearing in several category pairs is not rescanned and shared
+        keywords fall out of a bitwise AND.
+        """
+        # Interned names make the per-connection strings shared, cheap-to-hash objects
+        source_category = sys.intern(source_category)
+        target_category = sys.intern(target_category)
+        
+        family = tuple(keywords)
+        matcher = self._matchers.get(family)
+        if matcher is None:
+            matcher = self._matchers[family] = KeywordMatcher(family)
+        match_mask = matcher.mask
+        masks = self._mask_cache.setdefault(family, {})
+        source_masks = [(sys.intern(source_file),
+                         self._keyword_mask(match_mask, masks, source_category, source_file, content))
+                        for source_file, content in source_data.items()]
+        target_masks = [(sys.intern(target_file),
+                         self._keyword_mask(match_mask, masks, target_category, target_file, content))
+                        for target_file, content in target_data.items()]
+        
+        if detail_field is None:
+            source_hits = [source_file for source_file, mask in source_masks if mask & theme_bits]
+            target_hits = [target_file for target_file, mask in target_masks if mask & theme_bits]
+            return [Connection(
+                source_category, source_file, target_category, target_file,
+                connection_type, relevance_score,
+                description.format(source_file=source_file, target_file=target_file)
+            ) for source_file, target_file in product(source_hits, target_hits)]
+        
+        target_union, target_files = self._keyword_files(family, target_category, target_masks)
+        return [Connection(
+            source_category, source_file, target_category, target_file,
+            connection_type, relevance_score,
+            description.format(keyword=family[index], source_file=source_file, target_file=target_file),
+            family[index]
+        ) for source_file, index, target_file in self._shared_keyword_pairs(source_masks, target_union, target_files)]
+    
+    def _keyword_files(self, family: Tuple[str, ...], category: str,
+                       masks: List[Tuple[str, int]]) -> Tuple[int, Dict[int, List[str]]]:
+        """
+        Get a category's keyword-to-files index for a family.
+        
+        Returns the union of the files' bitsets and, for each keyword index
+        present, the files containing it in category order. Built by walking
+        each file's set bits once, and memoized per run so every category pair
+        with this target reuses it.
+        """
+        key = (family, category)
+        entry = self._keyword_files_cache.get(key)
+        if entry is None:
+            union = 0
+            files_by_keyword: Dict[int, List[str]] = {}
+            for file_name, mask in masks:
+                union |= mask
+                while mask:
+                    lowest = mask & -mask
+                    mask ^= lowest
+                    files_by_keyword.setdefault(lowest.bit_length() - 1, []).append(file_name)
+            entry = self._keyword_files_cache[key] = (union, files_by_keyword)
+        return entry
+    
+    @staticmethod
+    def _shared_keyword_pairs(source_masks: List[Tuple[str, int]], target_union: int,
+                              target_files: Dict[int, List[str]]) -> List[Tuple[str, int, str]]:
+        """
+        Enumerate (source_file, keyword_index, target_file) for every shared keyword.
+        
+        Only pairs that share a keyword are produced, ordered by source file,
+        then keyword, then target file, so connections are built for emitted
+        pairs alone and target files without any shared keyword are never visited.
+        """
+        pairs = []
+        if not target_union:
+            return pairs
+        for source_file, mask in source_masks:
+            # Walk the shared keyword bits from lowest, i.e. in keyword order
+            shared = mask & target_union
+            while shared:
+                lowest = shared & -shared
+                shared ^= lowest
+                index = lowest.bit_length() - 1
+                pairs.extend([(source_file, index, target_file) for target_file in target_files[index]])
+        return pairs
     
-    def integrate_cross_references(self, cross_references: Dict[str, List[Dict[str, Any]]]) -> None:
+    def _keyword_mask(self, match_mask: Callable[[str], int], masks: Dict[Tuple[str, str], int],
+                      category: str, file_name: str, content: Any) -> int:
+        """
+        Get the bitset of a family's keywords found in a file.
+        
+        Bit i is set when the file contains keyword i of the family. Results
+        are memoized in masks for the run.
+        """
+        key = (category, file_name)
+        mask = masks.get(key)
+        if mask is None:
+            mask = match_mask(self._searchable_text(category, file_name, content))
+            masks[key] = mask
+        return mask
+    
+    def _searchable_text(self, category: str, file_name: str, content: Any) -> str:
+        """
+        Get a file's lowercased leaf text.
+        
+        identify_cross_references fills the cache for every loaded file; the
+        fallback only serves finders called on other data.
+        """
+        key = (category, file_name)
+        text = self._lower_cache.get(key)
+        if text is None:
+            text = self._flatten_data(content).lower()
+            self._lower_cache[key] = text
+        return text
+    
+    def _flatten_data(self, data: Any) -> str:
+        """Flatten nested data structure into searchable text made of its leaf values."""
+        return ' '.join(self._iter_leaves(data))
+    
+    @staticmethod
+    def _iter_leaves(data: Any):
+        """
+        Yield the leaf values of nested dicts and lists as strings, in document order.
+        
+        Walks with an explicit stack, so deeply nested YAML cannot hit the
+        recursion limit, and never repr()s a container. Keys and None values
+        are not text content and are skipped.
+        """
+        stack = [data]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, dict):
+                stack.extend(reversed(list(item.values())))
+            elif isinstance(item, (list, tuple)):
+                stack.extend(reversed(item))
+            elif item is not None:
+                yield str(item)
+    
+    def integrate_cross_references(self, cross_references: Dict[str, List[Connection]]) -> None:
         """
         Integrate cross-references into the existing data structure.
         
+        Reference entries are grouped by destination file first, so each
+        YAML file is loaded and written once however many connections touch it,
+        and separate files are rewritten on a thread pool.
+        
         Args:
             cross_references: Dictionary of identified cross-references
         """
+        entries_by_path: Dict[Path, List[Dict[str, Any]]] = {}
+        file_index: Dict[Tuple[str, str], Path] = {}
+        indexed_categories: Set[str] = set()
         for connection_key, connections in cross_references.items():
             for connection in connections:
-                self._add_cross_reference(connection)
-    
-    def _add_cross_reference(self, connection: Dict[str, Any]) -> None:
-        """Add a single cross-reference to the appropriate files."""
-        source_category = connection['source_category']
-        source_file = connection['source_file']
-        target_category = connection['target_category']
-        target_file = connection['target_file']
-        
-        # Add cross-reference to source file
-        source_path = self.data_dir / source_category / f"{source_file}.yaml"
-        if source_path.exists():
-            self._add_reference_to_file(source_path, connection, 'source')
-        
-        # Add cross-reference to target file
-        target_path = self.data_dir / target_category / f"{target_file}.yaml"
-        if target_path.exists():
-            self._add_reference_to_file(target_path, connection, 'target')
-    
-    def _add_reference_to_file(self, file_path: Path, connection: Dict[str, Any], ref_type: str) -> None:
-        """Add cross-reference to a specific YAML file."""
+                for category in (connection.source_category, connection.target_category):
+                    if category not in indexed_categories:
+                        indexed_categories.add(category)
+                        self._index_category_files(category, file_index)
+                self._add_cross_reference(connection, entries_by_path, file_index)
+        
+        # Files are independent, so overlap their reads and writes, which
+        # release the GIL
+        if len(entries_by_path) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(entries_by_path), os.cpu_count() or 1)) as executor:
+                list(executor.map(self._add_references_to_file, entries_by_path.keys(), entries_by_path.values()))
+        else:
+            for file_path, ref_entries in entries_by_path.items():
+                self._add_references_to_file(file_path, ref_entries)
+        self.data_manager.save()
+    
+    def _index_category_files(self, category: str, file_index: Dict[Tuple[str, str], Path]) -> None:
+        """Record a category's YAML files as (category, stem) -> path with one directory scan."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = yaml.safe_load(file)
-            
-            # Initialize cross_references section if it doesn't exist
-            if 'cross_references' not in data:
-                data['cross_references'] = []
+            with os.scandir(self.data_dir / category) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.yaml') and entry.is_file():
+                        file_index[(category, entry.name[:-5])] = Path(entry.path)
+        except OSError:
+            pass
+    
+    def _add_cross_reference(self, connection: Connection,
+                             entries_by_path: Dict[Path, List[Dict[str, Any]]],
+                             file_index: Dict[Tuple[str, str], Path]) -> None:
+        """Queue a single cross-reference for the appropriate files that exist."""
+        for file_path, ref_type in (
+            (file_index.get((connection.source_category, connection.source_file)), 'source'),
+            (file_index.get((connection.target_category, connection.target_file)), 'target')
+        ):
+            if file_path is not None:
+                entries_by_path.setdefault(file_path, []).append(
+                    self._build_ref_entry(connection, ref_type)
+                )
+    
+    def _build_ref_entry(self, connection: Connection, ref_type: str) -> Dict[str, Any]:
+        """Build the cross_references entry written to the source or target file."""
+        if ref_type == 'source':
+            ref_entry = {
+                'type': 'outgoing',
+                'target_category': connection.target_category,
+                'target_file': connection.target_file,
+                'connection_type': connection.connection_type,
+                'relevance_score': connection.relevance_score,
+                'description': connection.description
+            }
+        else:  # target
+            ref_entry = {
+                'type': 'incoming',
+                'source_category': connection.source_category,
+                'source_file': connection.source_file,
+                'connection_type': connection.connection_type,
+                'relevance_score': connection.relevance_score,
+                'description': connection.description
+            }
+        
+        # Add the specific connection detail, if this connection type has one
+        detail_field = connection.detail_field
+        if detail_field is not None:
+            ref_entry[detail_field] = connection.detail
+        
+        return ref_entry
+    
+    @staticmethod
+    def _ref_key(ref_entry: Any) -> Tuple[Any, ...]:
+        """Identity of a cross_references entry: direction, other file, type and detail."""
+        if not isinstance(ref_entry, dict):
+            # Hand-written entries of another shape are kept as they are
+            return (id(ref_entry),)
+        incoming = ref_entry.get('type') == 'incoming'
+        other_category = ref_entry.get('source_category' if incoming else 'target_category')
+        other_file = ref_entry.get('source_file' if incoming else 'target_file')
+        detail = tuple(ref_entry.get(field) for field in CONNECTION_DETAIL_FIELDS.values())
+        return (ref_entry.get('type'), other_category, other_file, ref_entry.get('connection_type'), detail)
+    
+    @staticmethod
+    def _can_append_references(root: Any, raw: bytes) -> bool:
+        """
+        Whether new references can be appended to the raw file as text.
+        
+        True when the document is a block mapping whose last key is a non-empty,
+        unindented block cross_references list running to the end of the file,
+        which is how yaml.dump writes it. Entries dumped as a top-level list
+        then continue that list exactly as a full re-dump would.
+        """
+        if not isinstance(root, yaml.MappingNode) or root.flow_style or not root.value:
+            return False
+        key_node, value_node = root.value[-1]
+        return (isinstance(key_node, yaml.ScalarNode) and key_node.value == 'cross_references'
+                and isinstance(value_node, yaml.SequenceNode) and not value_node.flow_style
+                and bool(value_node.value) and value_node.start_mark.column == 0
+                and value_node.end_mark.column == 0 and value_node.end_mark.line == raw.count(b'\n'))
+    
+    def _add_references_to_file(self, file_path: Path, ref_entries: List[Dict[str, Any]]) -> None:
+        """
+        Upsert cross-references into a specific YAML file with one load and at most one write.
+        
+        Entries are keyed by direction, other category and file, connection type
+        and detail, so re-running the integration updates existing references
+        (keeping the highest relevance score) instead of appending duplicates.
+        The file is only written if something changed, and when every entry is
+        new and cross_references ends the file, the entries are appended as a
+        YAML snippet instead of re-dumping the whole document.
+        """
+        try:
+            with open(file_path, 'rb') as file:
+                raw = file.read()
+            # Compose and construct separately (as yaml.load does) to keep the node marks
+            loader = YamlLoader(raw)
+            try:
+                root = loader.get_single_node()
+                data = loader.construct_document(root) if root is not None else None
+            finally:
+                loader.dispose()
             
-            # Create reference entry
-            if ref_type == 'source':
-                ref_entry = {
-                    'type': 'outgoing',
-                    'target_category': connection['target_category'],
-                    'target_file': connection['target_file'],
-                    'connection_type': connection['connection_type'],
-                    'relevance_score': connection['relevance_score'],
-                    'description': connection['description']
-                }
-            else:  # target
-                ref_entry = {
-                    'type': 'incoming',
-                    'source_category': connection['source_category'],
-                    'source_file': connection['source_file'],
-                    'connection_type': connection['connection_type'],
-                    'relevance_score': connection['relevance_score'],
-                    'description': connection['description']
-                }
+            existing: Dict[Tuple[Any, ...], Any] = {}
+            rewrite = False
+            for ref_entry in data.get('cross_references') or []:
+                key = self._ref_key(ref_entry)
+                if key in existing:
+                    # Collapse duplicates left behind by earlier append-only runs
+                    rewrite = True
+                    kept = existing[key]
+                    if ref_entry.get('relevance_score', 0) > kept.get('relevance_score', 0):
+                        existing[key] = ref_entry
+                else:
+                    existing[key] = ref_entry
             
-            # Add specific connection details
-            if 'skill' in connection:
-                ref_entry['skill'] = connection['skill']
-            if 'project' in connection:
-                ref_entry['project'] = connection['project']
-            if 'trait' in connection:
-                ref_entry['trait'] = connection['trait']
-            if 'value' in connection:
-                ref_entry['value'] = connection['value']
+            added: List[Dict[str, Any]] = []
+            for ref_entry in ref_entries:
+                key = self._ref_key(ref_entry)
+                kept = existing.get(key)
+                if kept is None:
+                    existing[key] = ref_entry
+                    added.append(ref_entry)
+                else:
+                    merged = {**kept, **ref_entry,
+                              'relevance_score': max(ref_entry['relevance_score'], kept.get('relevance_score', 0))}
+                    if merged != kept:
+                        existing[key] = merged
+                        rewrite = True
             
-            data['cross_references'].append(ref_entry)
+            if not (added or rewrite):
+                self.logger.info(f"Cross-references already up to date in {file_path}")
+                return
             
-            # Save updated file
-            with open(file_path, 'w', encoding='utf-8') as file:
-                yaml.dump(data, file, default_flow_style=False, sort_keys=False, indent=2)
+            if not rewrite and self._can_append_references(root, raw):
+                with open(file_path, 'a', encoding='utf-8') as file:
+                    _dump_yaml(added, file)
+            else:
+                # Stored as a list for YAML compatibility
+                data['cross_references'] = list(existing.values())
+                
+                # Save updated file
+                with open(file_path, 'w', encoding='utf-8') as file:
+                    _dump_yaml(data, file)
             
-            self.logger.info(f"Added cross-reference to {file_path}")
+            self.data_manager.invalidate(file_path)
+            self.logger.info(f"Added {len(added)} cross-references to {file_path} "
+                             f"({len(ref_entries) - len(added)} updated or unchanged)")
             
         except Exception as e:
-            self.logger.error(f"Error adding cross-reference to {file_path}: {e}")
+            self.logger.error(f"Error adding cross-references to {file_path}: {e}")
     
-    def generate_cross_reference_report(self, cross_references: Dict[str, List[Dict[str, Any]]]) -> str:
+    def generate_cross_reference_report(self, cross_references: Dict[str, List[Connection]]) -> str:
         """Generate a report of all cross-references."""
-        report = "# Cross-Reference Integration Report\n\n"
+        # Collect pieces and join once; repeated += on the report is quadratic
+        parts: List[str] = ["# Cross-Reference Integration Report\n\n"]
+        append = parts.append
         
         total_connections = 0
         for connection_key, connections in cross_references.items():
             if connections:
-                report += f"## {connection_key.replace('_', ' ').title()}\n"
-                report += f"**Total Connections**: {len(connections)}\n\n"
+                append(f"## {connection_key.replace('_', ' ').title()}\n")
+                append(f"**Total Connections**: {len(connections)}\n\n")
                 
                 for connection in connections:
-                    report += f"- **{connection['connection_type']}**: {connection['description']}\n"
-                    report += f"  - Relevance: {connection['relevance_score']}\n"
-                    if 'skill' in connection:
-                        report += f"  - Skill: {connection['skill']}\n"
-                    if 'project' in connection:
-                        report += f"  - Project: {connection['project']}\n"
-                    if 'trait' in connection:
-                        report += f"  - Trait: {connection['trait']}\n"
-                    if 'value' in connection:
-                        report += f"  - Value: {connection['value']}\n"
-                    report += "\n"
+                    append(f"- **{connection.connection_type}**: {connection.description}\n")
+                    append(f"  - Relevance: {connection.relevance_score}\n")
+                    detail_field = connection.detail_field
+                    if detail_field is not None:
+                        append(f"  - {detail_field.title()}: {connection.detail}\n")
+                    append("\n")
                 
                 total_connections += len(connections)
         
-        report += f"\n## Summary\n"
-        report += f"- **Total Cross-References**: {total_connections}\n"
-        report += f"- **Categories Connected**: {len([k for k, v in cross_references.items() if v])}\n"
+        append(f"\n## Summary\n")
+        append(f"- **Total Cross-References**: {total_connections}\n")
+        append(f"- **Categories Connected**: {len([k for k, v in cross_references.items() if v])}\n")
         
-        return report
+        return "".join(parts)
     
     def run_integration(self) -> str:
         """Run the complete cross-reference integration process."""
@@ -5,22 +5,138 @@
 
 import yaml
 import os
+import gc
+import sys
+import mmap
+import pickle
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# libyaml's C loader is several times faster; fall back to pure Python without it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+
+class _InterningLoader(YamlLoader):
+    """
+    Loader that interns mapping keys.
+    
+    The same few keys repeat across every file, so cached trees share one
+    string object per key instead of one per occurrence, and the pickled
+    snapshot stores each key once.
+    """
+    
+    def construct_mapping(self, node, deep=False):
+        mapping = super().construct_mapping(node, deep=deep)
+        return {sys.intern(key) if type(key) is str else key: value for key, value in mapping.items()}
+
+
+# Smaller files are read in one call; mapping them costs more than it saves
+MMAP_MIN_SIZE = 4096
+
+# Conventional snapshot name, kept inside the data directory it describes
+SNAPSHOT_FILE = ".cache.pkl"
+
+
+@lru_cache(maxsize=256)
+def _parse_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Tuple[Any, Any]:
+    """
+    Parse a YAML file into (content, metadata), memoized on its path, mtime and size.
+    
+    The top-level ``metadata`` block is popped off the freshly parsed mapping,
+    so content needs no filtered copy. A rewritten file gets a new key, so
+    stale entries are never returned. The parsed trees are shared between
+    callers and must be treated as read-only.
+    Files are handed to libyaml as raw bytes, memory-mapped when large, so no
+    Python text decoding layer sits in between.
+    """
+    with open(path_str, 'rb') as file:
+        if size < MMAP_MIN_SIZE:
+            data = yaml.load(file.read(), Loader=_InterningLoader)
+        else:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                data = yaml.load(mapped, Loader=_InterningLoader)
+    logging.getLogger(__name__).info(f"Loaded {path_str}")
+    metadata = data.pop('metadata', {}) if isinstance(data, dict) else {}
+    return data, metadata
+
+
+def _collect_node_events(first: yaml.Event, events) -> List[yaml.Event]:
+    """Collect the events of one node, given its first event."""
+    collected = [first]
+    depth = 1 if isinstance(first, yaml.CollectionStartEvent) else 0
+    while depth:
+        event = next(events)
+        collected.append(event)
+        if isinstance(event, yaml.CollectionStartEvent):
+            depth += 1
+        elif isinstance(event, yaml.CollectionEndEvent):
+            depth -= 1
+    return collected
+
+
+def _scan_metadata_only(path_str: str) -> Any:
+    """
+    Read the top-level ``metadata`` value of a YAML file from its event stream.
+    
+    Parsing stops as soon as the value has been seen, so the rest of the
+    document is never composed or constructed; the data files keep their
+    metadata first. Returns {} if there is no such key.
+    
+    Raises:
+        ValueError: If the document is not a plain mapping this can handle
+            (merge keys, or aliases inside the metadata); use a full parse instead
+    """
+    with open(path_str, 'rb') as file:
+        events = yaml.parse(file, Loader=YamlLoader)
+        next(events)  # StreamStartEvent
+        if not isinstance(next(events), yaml.DocumentStartEvent) or \
+                not isinstance(next(events), yaml.MappingStartEvent):
+            raise ValueError("document root is not a mapping")
+        
+        while True:
+            key = next(events)
+            if isinstance(key, yaml.MappingEndEvent):
+                return {}
+            _collect_node_events(key, events)
+            value = _collect_node_events(next(events), events)
+            if isinstance(key, yaml.ScalarEvent):
+                if key.value == '<<':
+                    raise ValueError("merge keys need a full parse")
+                if key.value == 'metadata':
+                    break
+    
+    if any(isinstance(event, yaml.AliasEvent) for event in value):
+        raise ValueError("aliases need a full parse")
+    document = yaml.emit([yaml.StreamStartEvent(), yaml.DocumentStartEvent(), *value,
+                          yaml.DocumentEndEvent(), yaml.StreamEndEvent()])
+    return yaml.load(document, Loader=YamlLoader)
 
 class DataManager:
     """
     Manages loading and caching of modular YAML data files for the agentic companion.
     
     Supports both eager loading (all data at startup) and lazy loading (on-demand)
-    for optimal performance and memory usage.
+    for optimal performance and memory usage. Passing ``snapshot_file`` (e.g.
+    ``SNAPSHOT_FILE``) opts in to pickling the eager cache between runs; a
+    relative name is resolved inside ``data_dir``.
     """
     
-    def __init__(self, data_dir: str = "data", cache_enabled: bool = True):
+    def __init__(self, data_dir: str = "data", cache_enabled: bool = True,
+                 snapshot_file: Optional[str] = None):
         self.data_dir = Path(data_dir)
         self.cache_enabled = cache_enabled
-        self.cache: Dict[str, Any] = {}
+        self.snapshot_file = self.data_dir / snapshot_file if snapshot_file else None
+        # Eager cache, flat on (category, filename) with each category's files in load order
+        self._flat: Dict[Tuple[str, str], Any] = {}
+        self._by_category: Dict[str, List[str]] = {}
+        self._dir_listing: Dict[str, Tuple[int, List[Path]]] = {}
+        self._lower_text: Dict[Tuple[str, str], str] = {}
         self.logger = logging.getLogger(__name__)
         
         # Define data categories and their file patterns
@@ -32,80 +148,172 @@ class DataManager:
             'metadata': ['session_meta.yaml', 'tags.yaml']
         }
         
-        if cache_enabled:
+        if cache_enabled and not self._load_snapshot():
             self._load_all_data()
     
-    def _load_yaml_file(self, file_path: Path) -> Dict[str, Any]:
-        """Load a single YAML file with error handling."""
+    def _load_yaml_parts(self, file_path: Path) -> Tuple[Any, Any]:
+        """Load a single YAML file as (content, metadata) with error handling, reusing the parse if it is unchanged."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = yaml.safe_load(file)
-                self.logger.info(f"Loaded {file_path}")
-                return data
+            stat = os.stat(file_path)
+            return _parse_yaml_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
         except FileNotFoundError:
             self.logger.warning(f"File not found: {file_path}")
-            return {}
+            return {}, {}
         except yaml.YAMLError as e:
             self.logger.error(f"YAML parsing error in {file_path}: {e}")
-            return {}
+            return {}, {}
         except Exception as e:
             self.logger.error(f"Unexpected error loading {file_path}: {e}")
-            return {}
+            return {}, {}
+    
+    def _load_yaml_file(self, file_path: Path) -> Dict[str, Any]:
+        """Load a single YAML file's content, without its metadata block."""
+        return self._load_yaml_parts(file_path)[0]
     
     def _load_all_data(self):
         """Load all YAML files into cache."""
         self.logger.info("Loading all data files...")
         
+        self._lower_text.clear()
+        # Taken before reading, so a file changed mid-load invalidates the snapshot
+        signature = self._snapshot_signature() if self.snapshot_file else None
+        tasks = []
         for category, files in self.categories.items():
-            self.cache[category] = {}
+            self._by_category[category] = []
             category_dir = self.data_dir / category
             
             for filename in files:
                 file_path = category_dir / filename
                 if file_path.exists():
-                    data = self._load_yaml_file(file_path)
-                    # Extract the main content (remove metadata for caching)
-                    content = {k: v for k, v in data.items() if k != 'metadata'}
-                    self.cache[category][filename.replace('.yaml', '')] = content
+                    tasks.append((category, filename, file_path))
+        
+        # Overlap file reads and parsing across a small thread pool
+        if tasks:
+            with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+                loaded = list(executor.map(self._load_yaml_file, [task[2] for task in tasks]))
+            
+            for (category, filename, _), content in zip(tasks, loaded):
+                stem = filename.replace('.yaml', '')
+                self._flat[(category, stem)] = content
+                self._by_category[category].append(stem)
+        
+        self.logger.info(f"Loaded {len(self._by_category)} categories with {len(self._flat)} files")
+        self._save_snapshot(signature)
+    
+    def _snapshot_signature(self) -> List[Any]:
+        """Identify the eager cache's inputs: the category layout and each file's mtime and size."""
+        signature: List[Any] = [self.categories]
+        for category, files in self.categories.items():
+            for filename in files:
+                file_path = self.data_dir / category / filename
+                try:
+                    stat = file_path.stat()
+                    signature.append((str(file_path), stat.st_mtime_ns, stat.st_size))
+                except OSError:
+                    signature.append((str(file_path), None))
+        return signature
+    
+    def _load_snapshot(self) -> bool:
+        """Restore the eager cache from the snapshot if none of its files changed."""
+        if self.snapshot_file is None:
+            return False
+        # Unpickling allocates the whole tree at once; cyclic GC passes over
+        # it mid-load are pure overhead, since none of it is garbage yet
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(self.snapshot_file, 'rb') as file:
+                snapshot = pickle.load(file)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable data snapshot {self.snapshot_file}: {e}")
+            return False
+        finally:
+            if gc_enabled:
+                gc.enable()
+        
+        if not isinstance(snapshot, dict) or 'flat' not in snapshot or \
+                snapshot.get('signature') != self._snapshot_signature():
+            return False
         
-        self.logger.info(f"Loaded {len(self.cache)} categories with {sum(len(files) for files in self.cache.values())} files")
+        self._flat = snapshot['flat']
+        self._by_category = snapshot['by_category']
+        self.logger.info(f"Loaded {len(self._by_category)} categories from snapshot {self.snapshot_file}")
+        return True
+    
+    def _save_snapshot(self, signature: Optional[List[Any]]):
+        """Persist the eager cache, replacing the file atomically."""
+        if self.snapshot_file is None:
+            return
+        snapshot = {'signature': signature, 'flat': self._flat, 'by_category': self._by_category}
+        tmp_file = self.snapshot_file.with_name(self.snapshot_file.name + '.tmp')
+        try:
+            with open(tmp_file, 'wb') as file:
+                pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.snapshot_file)
+        except Exception as e:
+            self.logger.warning(f"Could not save data snapshot {self.snapshot_file}: {e}")
+    
+    def _searchable_text(self, category: str, filename: str, content: Any) -> str:
+        """Lowercased text a search query is matched against, built once per cached file."""
+        if not self.cache_enabled:
+            return str(content).lower()
+        key = (category, filename)
+        text = self._lower_text.get(key)
+        if text is None:
+            text = self._lower_text[key] = str(content).lower()
+        return text
+    
+    @property
+    def cache(self) -> Dict[str, Dict[str, Any]]:
+        """Eager cache as a nested {category: {filename: content}} mapping, built on access."""
+        return {category: {filename: self._flat[(category, filename)] for filename in files}
+                for category, files in self._by_category.items()}
     
     def get_category(self, category: str) -> Dict[str, Any]:
         """Get all data for a specific category."""
         if not self.cache_enabled:
             return self._load_category_lazy(category)
-        return self.cache.get(category, {})
+        return {filename: self._flat[(category, filename)] for filename in self._by_category.get(category, ())}
     
     def get_file(self, category: str, filename: str) -> Dict[str, Any]:
         """Get data from a specific file."""
         if not self.cache_enabled:
             return self._load_file_lazy(category, filename)
         
-        category_data = self.cache.get(category, {})
-        return category_data.get(filename, {})
+        return self._flat.get((category, filename), {})
     
     def _load_category_lazy(self, category: str) -> Dict[str, Any]:
         """Lazy load a category of files."""
         category_data = {}
         category_dir = self.data_dir / category
         
-        if not category_dir.exists():
+        try:
+            file_paths = self._list_category_files(category_dir)
+        except OSError:
             self.logger.warning(f"Category directory not found: {category_dir}")
             return category_data
         
-        for file_path in category_dir.glob("*.yaml"):
+        for file_path in file_paths:
             filename = file_path.stem
-            data = self._load_yaml_file(file_path)
-            content = {k: v for k, v in data.items() if k != 'metadata'}
-            category_data[filename] = content
+            category_data[filename] = self._load_yaml_file(file_path)
         
         return category_data
     
+    def _list_category_files(self, category_dir: Path) -> List[Path]:
+        """List a category's YAML files, re-globbing only when the directory's mtime changes."""
+        mtime_ns = category_dir.stat().st_mtime_ns
+        key = str(category_dir)
+        listing = self._dir_listing.get(key)
+        if listing is None or listing[0] != mtime_ns:
+            listing = self._dir_listing[key] = (mtime_ns, list(category_dir.glob("*.yaml")))
+        return listing[1]
+    
     def _load_file_lazy(self, category: str, filename: str) -> Dict[str, Any]:
         """Lazy load a specific file."""
         file_path = self.data_dir / category / f"{filename}.yaml"
-        data = self._load_yaml_file(file_path)
-        return {k: v for k, v in data.items() if k != 'metadata'}
+        return self._load_yaml_file(file_path)
     
     def search_content(self, query: str, categories: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
@@ -123,53 +331,68 @@ class DataManager:
         if categories is None:
             categories = list(self.categories.keys())
         
+        query_lower = query.lower()
+        
         for category in categories:
             category_data = self.get_category(category)
             
             for filename, content in category_data.items():
                 # Simple text search (could be enhanced with more sophisticated search)
-                content_str = str(content).lower()
-                if query.lower() in content_str:
-                    results.append({
-                        'category': category,
-                        'filename': filename,
-                        'content': content,
-                        'match_type': 'text_search'
-                    })
+                if query_lower not in self._searchable_text(category, filename, content):
+                    continue
+                results.append({
+                    'category': category,
+                    'filename': filename,
+                    'content': content,
+                    'match_type': 'text_search'
+                })
         
         return results
     
     def get_metadata(self, category: str, filename: str) -> Dict[str, Any]:
         """Get metadata for a specific file."""
         file_path = self.data_dir / category / f"{filename}.yaml"
-        data = self._load_yaml_file(file_path)
-        return data.get('metadata', {})
+        
+        # Without the eager cache the file is likely unparsed, so read only
+        # up to its metadata instead of parsing the whole document
+        if not self.cache_enabled:
+            try:
+                return _scan_metadata_only(str(file_path))
+            except FileNotFoundError:
+                self.logger.warning(f"File not found: {file_path}")
+                return {}
+            except (ValueError, StopIteration, yaml.YAMLError):
+                pass
+        
+        return self._load_yaml_parts(file_path)[1]
     
     def list_files(self, category: Optional[str] = None) -> Dict[str, List[str]]:
         """List all available files, optionally filtered by category."""
         if category:
-            return {category: list(self.cache.get(category, {}).keys())}
+            return {category: list(self._by_category.get(category, ()))}
         
-        return {cat: list(files.keys()) for cat, files in self.cache.items()}
+        return {cat: list(files) for cat, files in self._by_category.items()}
     
     def reload_cache(self):
         """Reload all data from disk."""
-        self.cache.clear()
+        _parse_yaml_cached.cache_clear()
+        self._flat.clear()
+        self._by_category.clear()
         self._load_all_data()
     
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about loaded data."""
         stats = {
             'total_categories': len(self.categories),
-            'total_files': sum(len(files) for files in self.cache.values()),
+            'total_files': len(self._flat),
             'cache_enabled': self.cache_enabled,
             'categories': {}
         }
         
-        for category, files in self.cache.items():
+        for category, files in self._by_category.items():
             stats['categories'][category] = {
                 'file_count': len(files),
-                'files': list(files.keys())
+                'files': list(files)
             }
         
         return stats
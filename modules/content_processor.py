@@ -10,21 +10,27 @@ Tags: content-processing, chunking, metadata, rag-integration
 """
 
 import os
+import re
 import json
-import yaml
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from .kb_scan import load_yaml_file
+
 logger = logging.getLogger(__name__)
 
+# A line whose first non-blank character is '#' starts a new writing section
+_HEADING_LINE = re.compile(r'^[^\S\n]*#[^\n]*', re.MULTILINE)
 
-@dataclass
+# File extensions picked up by process_content_directory
+CONTENT_EXTENSIONS = frozenset({'.pdf', '.txt', '.md', '.json', '.yaml', '.yml', '.docx'})
+
+
+@dataclass(slots=True)
 class ContentChunk:
-    """Standardized content chunk with metadata"""
+    """Standardized content chunk with metadata (slotted: one is built per chunk)"""
     id: str
     text: str
     metadata: Dict[str, Any]
@@ -177,7 +183,9 @@ class ContentProcessor:
                         'page_num': page_num + 1,
                         'text': page_text
                     })
-                    content['text'] += page_text + '\n'
+                
+                # Join once; += on a dict item copies the whole text per page
+                content['text'] = ''.join([page['text'] + '\n' for page in content['pages']])
             
             return content
             
@@ -245,10 +253,7 @@ class ContentProcessor:
     def _extract_yaml(self, file_path: Path) -> Dict[str, Any]:
         """Extract content from YAML files"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = yaml.safe_load(f)
-            
-            return content
+            return load_yaml_file(str(file_path))
         except Exception as e:
             logger.error(f"Error extracting YAML content: {e}")
             return {'raw_content': ''}
@@ -271,24 +276,28 @@ class ContentProcessor:
         return metadata
     
     def _extract_sections(self, content: str) -> List[Dict[str, str]]:
-        """Extract sections from writing content"""
+        """
+        Extract sections from writing content
+
+        Heading lines are located with one compiled regex and section bodies
+        are sliced straight out of the content, instead of splitting it into
+        lines and concatenating them back one at a time.
+        """
         sections = []
-        lines = content.split('\n')
-        current_section = {'title': 'Introduction', 'content': ''}
+        title = 'Introduction'
+        body_start = 0
         
-        for line in lines:
-            if line.strip().startswith('#'):
-                if current_section['content'].strip():
-                    sections.append(current_section)
-                current_section = {
-                    'title': line.strip('#').strip(),
-                    'content': ''
-                }
-            else:
-                current_section['content'] += line + '\n'
+        for heading in _HEADING_LINE.finditer(content):
+            body = content[body_start:heading.start()]
+            if body.strip():
+                sections.append({'title': title, 'content': body})
+            title = heading.group().strip('#').strip()
+            body_start = heading.end() + 1
         
-        if current_section['content'].strip():
-            sections.append(current_section)
+        # Every line of the last section, the final one included, ends in a newline
+        body = content[body_start:] + '\n' if body_start <= len(content) else ''
+        if body.strip():
+            sections.append({'title': title, 'content': body})
         
         return sections
     
@@ -478,13 +487,38 @@ def process_content_directory(directory_path: str, processor: Optional[ContentPr
         return results
     
     # Process all files in directory
-    for file_path in directory.rglob('*'):
-        if file_path.is_file() and file_path.suffix.lower() in ['.pdf', '.txt', '.md', '.json', '.yaml', '.yml', '.docx']:
-            try:
-                result = processor.process_content(str(file_path))
-                results.append(result)
-                logger.info(f"Processed {file_path.name}: {len(result.chunks)} chunks")
-            except Exception as e:
-                logger.error(f"Error processing {file_path}: {e}")
+    for file_path in _find_content_files(str(directory)):
+        try:
+            result = processor.process_content(file_path)
+            results.append(result)
+            logger.info(f"Processed {os.path.basename(file_path)}: {len(result.chunks)} chunks")
+        except Exception as e:
+            logger.error(f"Error processing {file_path}: {e}")
     
-    return results 
\ No newline at end of file
+    return results
+
+
+def _find_content_files(directory: str) -> List[str]:
+    """
+    Recursively find files with a supported content extension.
+
+    Uses an ``os.scandir`` stack instead of ``Path.rglob``, so directory and
+    file checks reuse the type information from each directory listing
+    rather than costing a stat per entry. Symlinked directories are not
+    descended into, matching ``rglob``.
+    """
+    found = []
+    pending = [directory]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in CONTENT_EXTENSIONS and entry.is_file():
+                        found.append(entry.path)
+        except OSError as e:
+            logger.warning(f"Could not scan {current}: {e}")
+    found.sort(key=lambda path: (os.path.dirname(path), os.path.basename(path)))
+    return found
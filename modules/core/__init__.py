@@ -27,9 +27,24 @@ from .interfaces import (
     CandidateResponse,
     EvaluationScore
 )
-from .orchestrator import AsyncConversationOrchestrator
-from .llm_client import UnifiedLLMClient
 from .model_config import ModelConfig, TaskType, Environment, get_model_config
+import importlib
+
+# The orchestrator and LLM client pull in openai, aiohttp, httpx and the RAG
+# drivers, so they are imported on first attribute access rather than with the
+# package (PEP 562). Importing a light submodule stays cheap this way.
+_LAZY_EXPORTS = {
+    "AsyncConversationOrchestrator": ".orchestrator",
+    "UnifiedLLMClient": ".llm_client",
+}
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __version__ = "0.1.0"
 __all__ = [
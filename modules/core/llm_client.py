@@ -21,14 +21,50 @@ import logging
 import asyncio
 import aiohttp
 import json
+import weakref
 from typing import Dict, Any, Optional, List, AsyncGenerator
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from openai.types.chat import ChatCompletionChunk
 import time
 from .model_config import get_model_config, TaskType, Environment
 
 logger = logging.getLogger(__name__)
 
+# Connection pools shared by every OpenAI client, one per event loop, since
+# an httpx.AsyncClient's connections belong to the loop that opened them
+_shared_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = \
+    weakref.WeakKeyDictionary()
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Get the running event loop's shared HTTP client for OpenAI requests
+    
+    The parser, synthesizer, evaluator and other components each hold their
+    own UnifiedLLMClient; sharing one sized pool lets them reuse keep-alive
+    connections instead of each opening a separate default-sized pool.
+    Must be called with an event loop running; each loop gets its own pool.
+    """
+    loop = asyncio.get_running_loop()
+    client = _shared_http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _shared_http_clients[loop] = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(max_connections=256, max_keepalive_connections=128),
+            timeout=httpx.Timeout(60.0)
+        )
+    return client
+
+async def close_shared_http_client() -> None:
+    """
+    Close the running event loop's shared HTTP client and its pooled connections
+    
+    Safe to call more than once; a later get_shared_http_client() call
+    opens a fresh pool. Pools of other loops are left alone.
+    """
+    client = _shared_http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
 class UnifiedLLMClient:
     """
     Unified LLM client with Ollama primary and OpenAI fallback
@@ -45,7 +81,8 @@ class UnifiedLLMClient:
                  enable_fallback: bool = True,
                  fallback_timeout: float = 300.0,
                  environment: Environment = Environment.DEVELOPMENT,
-                 force_openai_only: bool = False):
+                 force_openai_only: bool = False,
+                 http_client: Optional[httpx.AsyncClient] = None):
         """
         Initialize unified LLM client
         
@@ -57,6 +94,7 @@ class UnifiedLLMClient:
             enable_fallback: Whether to enable OpenAI fallback
             fallback_timeout: Timeout for Ollama requests before falling back
             environment: Environment type for model selection
+            http_client: HTTP client for OpenAI requests (defaults to the shared pool)
         """
         self.ollama_url = ollama_url.rstrip('/')
         self.environment = environment
@@ -83,7 +121,10 @@ class UnifiedLLMClient:
                 if force_openai_only:
                     raise ValueError("OpenAI API key is required when force_openai_only=True")
             else:
-                self.openai_client = AsyncOpenAI(api_key=self.openai_api_key)
+                # OpenAI clients are built per event loop on first use, see openai_client
+                self._http_client = http_client
+                self._openai_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = \
+                    weakref.WeakKeyDictionary()
         
         # Usage statistics
         self.usage_stats = {
@@ -101,6 +142,18 @@ class UnifiedLLMClient:
         if self.enable_fallback:
             logger.info(f"OpenAI fallback enabled with model: {openai_model}")
     
+    @property
+    def openai_client(self) -> AsyncOpenAI:
+        """OpenAI client for the running event loop, on that loop's shared pool unless one was given"""
+        loop = asyncio.get_running_loop()
+        client = self._openai_clients.get(loop)
+        if client is None or client.is_closed():
+            client = self._openai_clients[loop] = AsyncOpenAI(
+                api_key=self.openai_api_key,
+                http_client=self._http_client or get_shared_http_client()
+            )
+        return client
+    
     def get_model_for_task(self, task: TaskType) -> str:
         """
         Get the appropriate model for a specific task
@@ -21,6 +21,8 @@ from .rag.retriever import UnifiedRetriever
 from .synthesizer import AsyncLLMSynthesizer
 from .evaluator import LLMEvaluator, RetryOrchestrator
 from .context_manager import LLMContextManager
+from .response_cache import SemanticResponseCache
+from .llm_client import close_shared_http_client
 
 class AsyncConversationOrchestrator:
     """
@@ -34,7 +36,8 @@ class AsyncConversationOrchestrator:
                  model: str = "gpt-4o-mini",
                  rag_backend: str = "auto",
                  enable_evaluation: bool = True,
-                 enable_memory: bool = True):
+                 enable_memory: bool = True,
+                 enable_response_cache: bool = True):
         """
         Initialize the async conversation orchestrator
         
@@ -43,6 +46,7 @@ class AsyncConversationOrchestrator:
             rag_backend: RAG backend type ("auto", "simple", "chroma")
             enable_evaluation: Whether to use evaluation and retry logic
             enable_memory: Whether to use conversation memory
+            enable_response_cache: Whether to reuse responses for repeated turns
         """
         self.model = model
         self.enable_evaluation = enable_evaluation
@@ -74,6 +78,15 @@ class AsyncConversationOrchestrator:
         else:
             self.context_manager = None
         
+        if enable_response_cache:
+            # Reuse the retriever's embedding model for near-duplicate matching when it has one
+            embedding_model = getattr(self.retriever.backend, 'embedding_model', None)
+            embed_fn = embedding_model.encode if hasattr(embedding_model, 'encode') else None
+            self.response_cache = SemanticResponseCache(embed_fn=embed_fn)
+            print("✅ Response cache initialized")
+        else:
+            self.response_cache = None
+        
         print("🚀 Async conversation orchestrator ready!")
     
     async def process_message(self, user_input: str, voice_mode: bool = False, identity_override: str = None) -> Dict[str, Any]:
@@ -89,6 +102,24 @@ class AsyncConversationOrchestrator:
             Dict containing response and metadata
         """
         try:
+            # Conversation history is part of the cache key, so fetch it up front
+            conversation_history = None
+            if self.enable_memory and self.context_manager:
+                conversation_history = self.context_manager.get_conversation_context()
+            
+            # Step 0: Reuse the response for a repeated or near-duplicate turn
+            if self.response_cache:
+                cached = await self.response_cache.get(user_input, identity_override, voice_mode, conversation_history)
+                if cached is not None:
+                    print("⚡ Response cache hit, skipping pipeline")
+                    if self.enable_memory and self.context_manager:
+                        self.context_manager.add_turn(user_input, cached["response"], cached.get("metadata", {}))
+                    return {
+                        **cached,
+                        "metadata": {**cached["metadata"], "cache_hit": True},
+                        "usage": {key: 0 for key in cached.get("usage", {})}
+                    }
+            
             # Step 1: Parse user request
             print(f"🔤 Parsing request: {user_input[:50]}...")
             parsed_request, objective = await self.parser.parse_request(user_input, voice_mode)
@@ -120,10 +151,7 @@ class AsyncConversationOrchestrator:
             
             retrieved_context = context_list
             
-            # Step 3: Get conversation history if memory is enabled
-            conversation_history = None
-            if self.enable_memory and self.context_manager:
-                conversation_history = self.context_manager.get_conversation_context()
+            # Step 3: Conversation history was fetched before the cache lookup
             
             # Step 4: Generate response
             print("🧠 Generating response...")
@@ -136,24 +164,11 @@ class AsyncConversationOrchestrator:
             )
             
             # Step 5: Evaluate response quality if enabled
+            quality_score = None
             if self.enable_evaluation and self.evaluator:
                 print("📊 Evaluating response quality...")
-                
-                # Create CandidateResponse object for evaluation
-                from .interfaces import CandidateResponse
-                candidate_response = CandidateResponse(
-                    content=response["text"],
-                    confidence=response.get("metadata", {}).get("confidence", 0.8),
-                    reasoning=response.get("metadata", {}).get("reasoning", "Generated response"),
-                    voice_friendly=voice_mode
-                )
-                
-                # Evaluate using the correct interface
-                evaluation = await self.evaluator.evaluate(
-                    response=candidate_response,
-                    objective=objective,
-                    original_request=user_input
-                )
+                evaluation = await self._evaluate_response(response, objective, user_input, voice_mode)
+                quality_score = evaluation.overall_score
                 
                 # Retry if quality is poor
                 if evaluation.overall_score < 0.7 and self.retry_orchestrator:
@@ -169,6 +184,8 @@ class AsyncConversationOrchestrator:
                     if retry_response:
                         response = retry_response
                         response["metadata"]["retry_attempt"] = True
+                        # The retried response itself has not been evaluated
+                        quality_score = None
             
             # Step 6: Update conversation memory if enabled
             if self.enable_memory and self.context_manager:
@@ -187,6 +204,12 @@ class AsyncConversationOrchestrator:
                 },
                 "usage": response["usage"]
             }
+            if quality_score is not None:
+                final_response["metadata"]["confidence"] = quality_score
+            
+            if self.response_cache:
+                await self.response_cache.put(user_input, final_response, identity_override, voice_mode,
+                                              conversation_history)
             
             print("✅ Response generated successfully!")
             return final_response
@@ -208,6 +231,22 @@ class AsyncConversationOrchestrator:
             Response text chunks as they're generated
         """
         try:
+            conversation_history = None
+            if self.enable_memory and self.context_manager:
+                conversation_history = self.context_manager.get_conversation_context()
+            
+            # Step 0: Replay the response for a repeated or near-duplicate turn
+            if self.response_cache:
+                cached = await self.response_cache.get(user_input, identity_override, voice_mode, conversation_history)
+                if cached is not None:
+                    status_msg = "⚡ Response cache hit, skipping pipeline"
+                    print(status_msg)
+                    yield f"__STATUS__{status_msg}"
+                    yield cached["response"]
+                    if self.enable_memory and self.context_manager:
+                        self.context_manager.add_turn(user_input, cached["response"], cached.get("metadata", {}))
+                    return
+            
             # Step 1: Parse user request
             status_msg = f"🔤 Parsing request: {user_input[:50]}..."
             print(status_msg)
@@ -245,10 +284,7 @@ class AsyncConversationOrchestrator:
             
             retrieved_context = context_list
             
-            # Step 3: Get conversation history if memory is enabled
-            conversation_history = None
-            if self.enable_memory and self.context_manager:
-                conversation_history = self.context_manager.get_conversation_context()
+            # Step 3: Conversation history was fetched before the cache lookup
             
             # Step 4: Stream response generation
             status_msg = "🧠 Streaming response..."
@@ -270,6 +306,24 @@ class AsyncConversationOrchestrator:
             if self.enable_memory and self.context_manager:
                 self.context_manager.add_turn(user_input, full_response, {})
             
+            # Streamed text is unevaluated, so score it before offering it to the
+            # cache; the synthesizer reports stream failures as text, never cache those
+            if self.response_cache and self.enable_evaluation and self.evaluator and full_response \
+                    and not full_response.startswith("Error generating response:"):
+                status_msg = "📊 Evaluating response quality..."
+                print(status_msg)
+                yield f"__STATUS__{status_msg}"
+                evaluation = await self._evaluate_response({"text": full_response, "metadata": {}},
+                                                           objective, user_input, voice_mode)
+                await self.response_cache.put(user_input, {
+                    "response": full_response,
+                    "metadata": {"parsed_intent": parsed_request.intent, "objective": objective,
+                                 "context_count": len(retrieved_context), "voice_mode": voice_mode,
+                                 "model_used": self.model, "streamed": True,
+                                 "confidence": evaluation.overall_score},
+                    "usage": {"total_tokens": 0, "prompt_tokens": 0, "completion_tokens": 0}
+                }, identity_override, voice_mode, conversation_history)
+            
             status_msg = "✅ Streaming response completed!"
             print(status_msg)
             yield f"__STATUS__{status_msg}"
@@ -384,11 +438,42 @@ class AsyncConversationOrchestrator:
                 return True
             else:
                 print("📚 Using local YAML files as knowledge source...")
+                # The retriever's backend already loaded the data directory when it
+                # was constructed; without explicit files there is nothing new to load
+                if not yaml_files and getattr(self.retriever.backend, 'initialized', False):
+                    print("✅ Knowledge base already loaded, skipping re-initialization")
+                    return True
+                if self.response_cache:
+                    # Cached answers may reflect the previous knowledge base
+                    self.response_cache.clear()
                 return self.retriever.initialize_from_yaml(yaml_files)
         except Exception as e:
             print(f"❌ Knowledge base initialization failed: {str(e)}")
             return False
     
+    async def initialize_knowledge_base_async(self, yaml_files: Optional[list] = None) -> bool:
+        """Initialize the knowledge base on a worker thread so the event loop stays free"""
+        return await asyncio.to_thread(self.initialize_knowledge_base, yaml_files)
+    
+    async def aclose(self):
+        """Close pooled OpenAI connections shared by the pipeline's LLM clients"""
+        await close_shared_http_client()
+    
+    async def _evaluate_response(self, response: Dict[str, Any], objective, user_input: str, voice_mode: bool):
+        """Score a synthesized response (text and metadata) against the turn's objective"""
+        from .interfaces import CandidateResponse
+        candidate_response = CandidateResponse(
+            content=response["text"],
+            confidence=response.get("metadata", {}).get("confidence", 0.8),
+            reasoning=response.get("metadata", {}).get("reasoning", "Generated response"),
+            voice_friendly=voice_mode
+        )
+        return await self.evaluator.evaluate(
+            response=candidate_response,
+            objective=objective,
+            original_request=user_input
+        )
+    
     def _get_context_scope(self, intent: str):
         """Convert intent to context scope"""
         from .interfaces import ContextScope
@@ -6,10 +6,10 @@ Falls back gracefully if ChromaDB is not available.
 """
 
 import os
-import yaml
 import uuid
 import glob
 from typing import List, Dict, Any, Optional
+from ....kb_scan import YAML_INDEX_FILE, discover_yaml_files, load_yaml_file, parse_yaml_files
 
 class ChromaDriver:
     """
@@ -90,10 +90,7 @@ class ChromaDriver:
         print(f"🔨 Building ChromaDB knowledge base from {self.data_dir}")
         
         # Find all YAML files
-        yaml_files = []
-        if os.path.exists(self.data_dir):
-            yaml_files = glob.glob(os.path.join(self.data_dir, "**/*.yaml"), recursive=True)
-            yaml_files.extend(glob.glob(os.path.join(self.data_dir, "**/*.yml"), recursive=True))
+        yaml_files = discover_yaml_files(self.data_dir, index_file=YAML_INDEX_FILE)
         
         # Also check root directory
         yaml_files.extend(glob.glob("*.yaml"))
@@ -103,9 +100,10 @@ class ChromaDriver:
         metadatas = []
         ids = []
         
-        for yaml_file in yaml_files:
+        parsed = parse_yaml_files(yaml_files)
+        for yaml_file, data in parsed.items():
             try:
-                chunks = self._extract_text_from_yaml(yaml_file)
+                chunks = self._extract_text_from_data(yaml_file, data)
                 for i, chunk in enumerate(chunks):
                     documents.append(chunk)
                     metadatas.append({
@@ -141,9 +139,16 @@ class ChromaDriver:
     def _extract_text_from_yaml(self, yaml_file: str) -> List[str]:
         """Extract meaningful text chunks from YAML file"""
         try:
-            with open(yaml_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            
+            data = load_yaml_file(yaml_file)
+        except Exception as e:
+            print(f"⚠️ Error extracting from {yaml_file}: {e}")
+            return []
+        
+        return self._extract_text_from_data(yaml_file, data)
+    
+    def _extract_text_from_data(self, yaml_file: str, data: Any) -> List[str]:
+        """Extract meaningful text chunks from already-parsed YAML data"""
+        try:
             chunks = []
             file_basename = os.path.basename(yaml_file)
             
@@ -266,17 +271,17 @@ class ChromaDriver:
                 metadatas = []
                 ids = []
                 
-                for yaml_file in yaml_files:
-                    if os.path.exists(yaml_file):
-                        chunks = self._extract_text_from_yaml(yaml_file)
-                        for i, chunk in enumerate(chunks):
-                            documents.append(chunk)
-                            metadatas.append({
-                                'source': yaml_file,
-                                'file': os.path.basename(yaml_file),
-                                'chunk_id': i
-                            })
-                            ids.append(f"{os.path.basename(yaml_file)}_{i}_{uuid.uuid4().hex[:8]}")
+                parsed = parse_yaml_files([f for f in yaml_files if os.path.exists(f)])
+                for yaml_file, data in parsed.items():
+                    chunks = self._extract_text_from_data(yaml_file, data)
+                    for i, chunk in enumerate(chunks):
+                        documents.append(chunk)
+                        metadatas.append({
+                            'source': yaml_file,
+                            'file': os.path.basename(yaml_file),
+                            'chunk_id': i
+                        })
+                        ids.append(f"{os.path.basename(yaml_file)}_{i}_{uuid.uuid4().hex[:8]}")
                 
                 if documents:
                     self.collection.add(
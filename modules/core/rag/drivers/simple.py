@@ -6,11 +6,14 @@ Designed for reliability with minimal dependencies.
 """
 
 import os
-import yaml
 import numpy as np
 import pickle
 import glob
 from typing import List, Dict, Any, Optional
+from ....kb_scan import (YAML_INDEX_FILE, discover_yaml_files, load_yaml_file, parse_yaml_files,
+                         yaml_content_fingerprint, yaml_fingerprint)
+
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 
 class SimpleDriver:
     """
@@ -21,8 +24,8 @@ class SimpleDriver:
     """
     
     def __init__(self, 
-                 embedding_model: str = "all-MiniLM-L6-v2",
-                 embeddings_file: str = "./simple_embeddings.pkl",
+                 embedding_model: str = DEFAULT_EMBEDDING_MODEL,
+                 embeddings_file: str = "./.cache/simple_embeddings.pkl",
                  data_dir: str = "./data"):
         """
         Initialize the simple RAG driver
@@ -46,23 +49,46 @@ class SimpleDriver:
             # Load embedding model
             print(f"🔄 Loading embedding model: {self.embedding_model_name}")
             try:
-                from sentence_transformers import SentenceTransformer
-                self.embedding_model = SentenceTransformer(self.embedding_model_name)
+                from ....embedding_models import get_embedding_model
+                self.embedding_model = get_embedding_model(self.embedding_model_name)
             except ImportError:
                 print("⚠️ sentence-transformers not available, using basic text matching")
                 self.embedding_model = None
                 return self._initialize_basic_mode()
             
-            # Try to load existing embeddings
+            # Reuse saved embeddings only if no knowledge file has changed since
+            yaml_files = self._find_yaml_files()
+            fingerprint = yaml_fingerprint(yaml_files)
+            data = None
             if os.path.exists(self.embeddings_file):
-                print(f"📄 Loading existing embeddings from {self.embeddings_file}")
                 with open(self.embeddings_file, 'rb') as f:
                     data = pickle.load(f)
-                    self.documents = data['documents']
-                    self.embeddings = data['embeddings']
+            # Vectors from another model are unusable (their dimensions may differ),
+            # so treat them as a miss; files written before the model was recorded
+            # were built with the default model
+            same_model = data is not None and \
+                data.get('embedding_model', DEFAULT_EMBEDDING_MODEL) == self.embedding_model_name
+            
+            # Stat data changes on every checkout, so confirm a stat miss by content
+            if (same_model and data.get('fingerprint') != fingerprint
+                    and data.get('content_fingerprint') == yaml_content_fingerprint(yaml_files)):
+                data['fingerprint'] = fingerprint
+                self._save_embeddings(data)
+            
+            if same_model and data.get('fingerprint') == fingerprint:
+                print(f"📄 Loading existing embeddings from {self.embeddings_file} (cache hit, {len(yaml_files)} files unchanged)")
+                self.documents = data['documents']
+                self.embeddings = data['embeddings']
+                # Nothing was encoded on this path, so pay the first-call cost now
+                # (during startup) rather than on the first user query
+                self._warm_up_embedding_model()
             else:
-                # Create new embeddings from data
-                self._build_knowledge_base()
+                if data is not None and not same_model:
+                    print(f"♻️ {self.embeddings_file} was built with {data.get('embedding_model', DEFAULT_EMBEDDING_MODEL)} (cache miss)")
+                elif data is not None:
+                    print(f"♻️ Knowledge files changed since {self.embeddings_file} was built (cache miss)")
+                # Create new embeddings from data, reusing vectors for unchanged chunks
+                self._build_knowledge_base(yaml_files, fingerprint, previous=data)
             
             self.initialized = True
             print(f"✅ Simple RAG initialized with {len(self.documents)} documents")
@@ -72,25 +98,47 @@ class SimpleDriver:
             print(f"❌ Failed to initialize Simple RAG: {e}")
             return False
     
-    def _build_knowledge_base(self):
-        """Build knowledge base from YAML files in data directory"""
-        print(f"🔨 Building knowledge base from {self.data_dir}")
-        
+    def _warm_up_embedding_model(self):
+        """Run a throwaway encode so lazy model setup happens before the first query"""
+        try:
+            self.embedding_model.encode(["warmup"], convert_to_numpy=True)
+        except Exception as e:
+            print(f"⚠️ Embedding model warm-up failed: {e}")
+    
+    def _find_yaml_files(self) -> List[str]:
+        """Find YAML files in the data directory and the working directory root"""
         # Find all YAML files recursively
-        yaml_files = []
-        if os.path.exists(self.data_dir):
-            yaml_files = glob.glob(os.path.join(self.data_dir, "**/*.yaml"), recursive=True)
-            yaml_files.extend(glob.glob(os.path.join(self.data_dir, "**/*.yml"), recursive=True))
+        yaml_files = discover_yaml_files(self.data_dir, index_file=YAML_INDEX_FILE)
         
         # Also check for YAML files in root directory
         yaml_files.extend(glob.glob("*.yaml"))
         yaml_files.extend(glob.glob("*.yml"))
+        return yaml_files
+    
+    def _build_knowledge_base(self, yaml_files: Optional[List[str]] = None, fingerprint: Optional[str] = None,
+                              previous: Optional[Dict[str, Any]] = None):
+        """
+        Build knowledge base from YAML files in data directory
+
+        Args:
+            yaml_files: Knowledge files to index (discovered if omitted)
+            fingerprint: Fingerprint of yaml_files (computed if omitted)
+            previous: Earlier contents of the embeddings file, whose vectors
+                are reused for chunks whose text has not changed
+        """
+        print(f"🔨 Building knowledge base from {self.data_dir}")
+        
+        if yaml_files is None:
+            yaml_files = self._find_yaml_files()
+        if fingerprint is None:
+            fingerprint = yaml_fingerprint(yaml_files)
         
         self.documents = []
         
-        for yaml_file in yaml_files:
+        parsed = parse_yaml_files(yaml_files)
+        for yaml_file, data in parsed.items():
             try:
-                chunks = self._extract_text_from_yaml(yaml_file)
+                chunks = self._extract_text_from_data(yaml_file, data)
                 for chunk in chunks:
                     self.documents.append({
                         'content': chunk,
@@ -111,24 +159,58 @@ class SimpleDriver:
         # Create embeddings
         print(f"🔄 Creating embeddings for {len(self.documents)} documents")
         texts = [doc['content'] for doc in self.documents]
-        self.embeddings = self.embedding_model.encode(texts, convert_to_numpy=True)
+        self.embeddings = self._encode_texts(texts, previous)
         
-        # Save embeddings
-        os.makedirs(os.path.dirname(self.embeddings_file), exist_ok=True)
+        self._save_embeddings({
+            'documents': self.documents,
+            'embeddings': self.embeddings,
+            'fingerprint': fingerprint,
+            'content_fingerprint': yaml_content_fingerprint(yaml_files),
+            'embedding_model': self.embedding_model_name
+        })
+    
+    def _save_embeddings(self, data: Dict[str, Any]):
+        """Write the embeddings file, creating its directory if needed"""
+        os.makedirs(os.path.dirname(self.embeddings_file) or ".", exist_ok=True)
         with open(self.embeddings_file, 'wb') as f:
-            pickle.dump({
-                'documents': self.documents,
-                'embeddings': self.embeddings
-            }, f)
+            pickle.dump(data, f)
         
         print(f"💾 Saved embeddings to {self.embeddings_file}")
     
+    def _encode_texts(self, texts: List[str], previous: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """
+        Embed texts, encoding only those without a vector from a previous build
+
+        Editing one knowledge file changes the fingerprint, but most chunk texts
+        are byte-identical to the last build, so their vectors are looked up by
+        text instead of being re-embedded. Duplicate texts are encoded once.
+        """
+        known: Dict[str, np.ndarray] = {}
+        # Files written before the model was recorded were built with the default model
+        if previous and previous.get('embedding_model', DEFAULT_EMBEDDING_MODEL) == self.embedding_model_name:
+            known = dict(zip((doc['content'] for doc in previous['documents']), previous['embeddings']))
+        
+        missing = list(dict.fromkeys(text for text in texts if text not in known))
+        if known:
+            reused = sum(1 for text in texts if text in known)
+            print(f"♻️ Reusing embeddings for {reused} of {len(texts)} chunks")
+        if missing:
+            known.update(zip(missing, self.embedding_model.encode(missing, convert_to_numpy=True)))
+        return np.stack([known[text] for text in texts])
+    
     def _extract_text_from_yaml(self, yaml_file: str) -> List[str]:
         """Extract meaningful text chunks from YAML file"""
         try:
-            with open(yaml_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            
+            data = load_yaml_file(yaml_file)
+        except Exception as e:
+            print(f"⚠️ Error extracting from {yaml_file}: {e}")
+            return []
+        
+        return self._extract_text_from_data(yaml_file, data)
+    
+    def _extract_text_from_data(self, yaml_file: str, data: Any) -> List[str]:
+        """Extract meaningful text chunks from already-parsed YAML data"""
+        try:
             chunks = []
             file_basename = os.path.basename(yaml_file)
             
@@ -241,15 +323,15 @@ class SimpleDriver:
         if yaml_files:
             # Override data directory with specific files
             temp_docs = []
-            for yaml_file in yaml_files:
-                if os.path.exists(yaml_file):
-                    chunks = self._extract_text_from_yaml(yaml_file)
-                    for chunk in chunks:
-                        temp_docs.append({
-                            'content': chunk,
-                            'source': yaml_file,
-                            'metadata': {'file': yaml_file}
-                        })
+            parsed = parse_yaml_files([f for f in yaml_files if os.path.exists(f)])
+            for yaml_file, data in parsed.items():
+                chunks = self._extract_text_from_data(yaml_file, data)
+                for chunk in chunks:
+                    temp_docs.append({
+                        'content': chunk,
+                        'source': yaml_file,
+                        'metadata': {'file': yaml_file}
+                    })
             
             if temp_docs:
                 self.documents = temp_docs
@@ -264,20 +346,14 @@ class SimpleDriver:
         print("🔧 Initializing basic text matching mode")
         
         # Build knowledge base from YAML files
-        yaml_files = []
-        if os.path.exists(self.data_dir):
-            yaml_files = glob.glob(os.path.join(self.data_dir, "**/*.yaml"), recursive=True)
-            yaml_files.extend(glob.glob(os.path.join(self.data_dir, "**/*.yml"), recursive=True))
-        
-        # Also check for YAML files in root directory
-        yaml_files.extend(glob.glob("*.yaml"))
-        yaml_files.extend(glob.glob("*.yml"))
+        yaml_files = self._find_yaml_files()
         
         self.documents = []
         
-        for yaml_file in yaml_files:
+        parsed = parse_yaml_files(yaml_files)
+        for yaml_file, data in parsed.items():
             try:
-                chunks = self._extract_text_from_yaml(yaml_file)
+                chunks = self._extract_text_from_data(yaml_file, data)
                 for chunk in chunks:
                     self.documents.append({
                         'content': chunk,
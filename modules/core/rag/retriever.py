@@ -6,7 +6,6 @@ and supports multiple backend implementations through a driver pattern.
 """
 
 from typing import List, Dict, Any, Optional
-import openai
 import json
 from ..interfaces import BaseRetriever, RAGContext, ContextScope
 from ..semantic_analyzer import SemanticAnalyzer
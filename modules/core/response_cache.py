@@ -0,0 +1,173 @@
+"""
+modules.core.response_cache - In-process semantic cache for orchestrator responses
+
+This module lets the orchestrator skip the full parse → retrieve → generate →
+evaluate pipeline when a user repeats, or nearly repeats, an earlier turn.
+
+Key Features:
+- Exact-match lookup on normalized text, identity, voice mode and the previous reply
+- Embedding similarity lookup when an embedding model is available
+- Embeddings computed on a worker thread so the event loop is never blocked
+- Bounded size with least-recently-used eviction
+- Unevaluated, low-confidence and error responses are never cached
+"""
+
+import re
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Cache key: (normalized text, identity, voice mode, digest of the previous assistant reply)
+CacheKey = Tuple[str, str, bool, str]
+
+class SemanticResponseCache:
+    """
+    Semantic response cache keyed by user turn, identity, voice mode and context
+
+    Entries are matched exactly on normalized text first; if an embedding
+    function is configured, a turn whose embedding has cosine similarity of
+    at least ``similarity_threshold`` with a cached turn is also a hit.
+    Candidates must share identity, voice mode and the assistant reply that
+    preceded the turn, so a follow-up like "tell me more" only reuses an
+    answer given after the same reply. Only that one reply is keyed, since
+    the full history grows every turn and would make repeats unmatchable.
+    """
+
+    def __init__(self,
+                 embed_fn: Optional[Callable[[str], Any]] = None,
+                 similarity_threshold: float = 0.95,
+                 min_confidence: float = 0.7,
+                 max_entries: int = 256):
+        """
+        Initialize the response cache
+
+        Args:
+            embed_fn: Optional function mapping text to an embedding vector
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            min_confidence: Responses below this confidence, or without one, are not cached
+            max_entries: Maximum number of cached responses
+        """
+        self.embed_fn = embed_fn
+        self.similarity_threshold = similarity_threshold
+        self.min_confidence = min_confidence
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Dict[str, Any]]" = OrderedDict()
+        self._vectors: Dict[CacheKey, np.ndarray] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, user_input: str, identity: Optional[str], voice_mode: bool,
+             context: Optional[List[Dict[str, Any]]]) -> CacheKey:
+        """Build the exact-match key for a turn"""
+        text = _WHITESPACE.sub(" ", user_input.strip().lower())
+        return (text, identity or "", voice_mode, self._context_digest(context))
+
+    @staticmethod
+    def _context_digest(context: Optional[List[Dict[str, Any]]]) -> str:
+        """Digest of the last assistant reply in the conversation history"""
+        for entry in reversed(context or ()):
+            if entry.get("assistant_response"):
+                return hashlib.blake2b(entry["assistant_response"].encode("utf-8"), digest_size=16).hexdigest()
+        return ""
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Embed and L2-normalize text, or return None if embeddings are unavailable"""
+        if self.embed_fn is None:
+            return None
+        try:
+            vector = np.asarray(self.embed_fn(text), dtype=np.float32).ravel()
+        except Exception as e:
+            logger.warning(f"Response cache embedding failed ({e}), using exact matching only")
+            self.embed_fn = None
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    async def get(self, user_input: str, identity: Optional[str] = None, voice_mode: bool = False,
+                  context: Optional[List[Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response for a turn
+
+        Args:
+            user_input: User's input message
+            identity: Identity override in effect for the turn
+            voice_mode: Whether the turn came from voice interaction
+            context: Conversation history; its last assistant reply is part of the key
+
+        Returns:
+            Cached response dict, or None on a miss
+        """
+        key = self._key(user_input, identity, voice_mode, context)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        candidates: List[CacheKey] = [k for k in self._vectors if k[1:] == key[1:]]
+        query_vector = await asyncio.to_thread(self._embed, key[0]) if candidates else None
+        # Entries may have been evicted while the embedding was computed
+        candidates = [k for k in candidates if k in self._vectors]
+        if query_vector is not None and candidates:
+            matrix = np.stack([self._vectors[k] for k in candidates])
+            scores = matrix @ query_vector
+            best = int(np.argmax(scores))
+            if scores[best] >= self.similarity_threshold:
+                match = candidates[best]
+                self._entries.move_to_end(match)
+                self.hits += 1
+                return self._entries[match]
+
+        self.misses += 1
+        return None
+
+    async def put(self, user_input: str, response: Dict[str, Any], identity: Optional[str] = None,
+                  voice_mode: bool = False, context: Optional[List[Dict[str, Any]]] = None) -> None:
+        """
+        Cache a response if it is good enough to reuse
+
+        Args:
+            user_input: User's input message
+            response: Final response dict; its metadata must carry an
+                evaluated ``confidence``
+            identity: Identity override in effect for the turn
+            voice_mode: Whether the turn came from voice interaction
+            context: Conversation history; its last assistant reply is part of the key
+        """
+        metadata = response.get("metadata", {})
+        confidence = metadata.get("confidence")
+        if metadata.get("error") or confidence is None or confidence < self.min_confidence:
+            return
+
+        key = self._key(user_input, identity, voice_mode, context)
+        vector = await asyncio.to_thread(self._embed, key[0])
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        if vector is not None:
+            self._vectors[key] = vector
+
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._vectors.pop(evicted, None)
+
+    def clear(self) -> None:
+        """Drop all cached responses"""
+        self._entries.clear()
+        self._vectors.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "semantic": self.embed_fn is not None
+        }
@@ -9,7 +9,6 @@ This module provides robust alternatives to brittle keyword searches by using:
 - Conversation flow analysis
 """
 
-import openai
 from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 import numpy as np
@@ -282,14 +281,13 @@ Return ONLY valid JSON, no other text."""
             List of (context, similarity_score) tuples
         """
         try:
-            # Use UnifiedLLMClient embeddings for semantic similarity
-            query_embedding = await self.client.get_embedding(query, model="text-embedding-3-small")
-            
-            context_embeddings = await self.client.get_embeddings_batch(contexts, model="text-embedding-3-small")
-            
+            # Embed the query and all contexts in a single batched request
+            embeddings = await self.client.get_embeddings_batch([query] + contexts, model="text-embedding-3-small")
+            query_embedding, context_embeddings = embeddings[0], embeddings[1:]
+
             similarities = []
             for i, context_embedding in enumerate(context_embeddings):
-                similarity = self._cosine_similarity(query_embedding, context_embedding.embedding)
+                similarity = self._cosine_similarity(query_embedding, context_embedding)
                 similarities.append((contexts[i], similarity))
             
             # Sort by similarity score
@@ -13,6 +13,7 @@ Key Features:
 
 import gradio as gr
 import time
+import contextlib
 from typing import List, Dict, Any
 from datetime import datetime
 
@@ -705,7 +706,7 @@ class CypherpunkInterface:
                     original_print = builtins.print
                     
                     def capture_print(*args, **kwargs):
-                        status_callback(" ".join(str(arg) for arg in args))
+                        status_callback(" ".join(map(str, args)))
                         original_print(*args, **kwargs)
                     
                     builtins.print = capture_print
@@ -748,14 +749,12 @@ class CypherpunkInterface:
                         # Restore original print function
                         builtins.print = original_print
                     
-                    # Final debug update
-                    new_logs += f"\n[{timestamp}] ✅ RESPONSE: Generated {chunk_count} chunks successfully"
-                    
-                    # Format metadata for console (simplified for streaming)
-                    new_logs += f"\n[{timestamp}] 📊 METADATA: Streamed {chunk_count} chunks"
-                    
-                    # Update debug logs
-                    new_logs += f"\n[{timestamp}] 🎯 STATUS: Ready for next input"
+                    # Final debug update, response/metadata/status lines built in one pass
+                    new_logs += (
+                        f"\n[{timestamp}] ✅ RESPONSE: Generated {chunk_count} chunks successfully"
+                        f"\n[{timestamp}] 📊 METADATA: Streamed {chunk_count} chunks"
+                        f"\n[{timestamp}] 🎯 STATUS: Ready for next input"
+                    )
                     
                 except Exception as e:
                     error_msg = f"❌ ERROR: {str(e)}"
@@ -816,4 +815,15 @@ class CypherpunkInterface:
         print("\nThe interface will open in your browser.")
         print("Welcome to the future, hacker...")
         
-        self.ui.launch(share=share, debug=debug) 
\ No newline at end of file
+        self.ui.launch(share=share, debug=debug, app_kwargs={"lifespan": self._lifespan})
+    
+    @contextlib.asynccontextmanager
+    async def _lifespan(self, app):
+        """
+        Server lifespan hook: close pooled HTTP connections when the server stops.
+        
+        Handlers run on the server's own event loop, which owns the connection
+        pool they used, so the pool can only be closed from here.
+        """
+        yield
+        await self.orchestrator.aclose() 
\ No newline at end of file
@@ -12,6 +12,7 @@ Tags: digi-core, integration, response-enhancement, personal-context
 
 import os
 import time
+import asyncio
 from typing import Dict, Optional, List
 from .rag.rag_digi_core import DigiCoreBackend
 
@@ -276,4 +277,39 @@ def check_digi_core_health() -> Dict:
         Health status dictionary
     """
     integration = get_digi_core_integration()
-    return integration.health_check() 
\ No newline at end of file
+    return integration.health_check()
+
+# Last health probe result, reused across hot reloads within the TTL
+_last_health = {"checked_at": 0.0, "healthy": None}
+
+def check_digi_core_health_cached(ttl: float = 60.0) -> Dict:
+    """
+    Check Digi-Core health, reusing a recent result.
+    
+    Args:
+        ttl: Seconds a previous result stays valid
+        
+    Returns:
+        Health status dictionary
+    """
+    now = time.monotonic()
+    if _last_health["healthy"] is not None and now - _last_health["checked_at"] < ttl:
+        return _last_health["healthy"]
+    health = check_digi_core_health()
+    _last_health.update(checked_at=now, healthy=health)
+    return health
+
+async def check_digi_core_health_async(ttl: float = 60.0) -> Dict:
+    """
+    Async variant of check_digi_core_health_cached for use during startup.
+    
+    Runs the blocking health probe on a worker thread so it can overlap
+    with other initialization work.
+    
+    Args:
+        ttl: Seconds a previous result stays valid
+        
+    Returns:
+        Health status dictionary
+    """
+    return await asyncio.to_thread(check_digi_core_health_cached, ttl)
@@ -0,0 +1,42 @@
+"""
+embedding_models.py - Shared sentence-transformer models for Beep-Boop
+
+Loading a sentence-transformer takes seconds and holds its weights in
+memory, so every RAG driver and backend gets its model from here and a
+process loads each model once, however many components use it.
+
+File: modules/embedding_models.py
+Purpose: Process-wide cache of embedding models
+Related: SimpleDriver, SimpleEmbeddingRAG, ChromaDBBackend, HuggingFaceBackend, PineconeBackend
+Tags: embeddings, models, startup
+"""
+
+import threading
+from typing import Dict
+
+from sentence_transformers import SentenceTransformer
+
+_models: Dict[str, SentenceTransformer] = {}
+_models_lock = threading.Lock()
+
+
+def get_embedding_model(model_name: str) -> SentenceTransformer:
+    """
+    Return the shared model for a name, loading it on first use.
+
+    Encoding does not modify the model, so one instance can serve every
+    caller, including concurrent threads.
+
+    Args:
+        model_name: Sentence transformer model name
+
+    Returns:
+        The process-wide SentenceTransformer for model_name
+    """
+    model = _models.get(model_name)
+    if model is None:
+        with _models_lock:
+            model = _models.get(model_name)
+            if model is None:
+                model = _models[model_name] = SentenceTransformer(model_name)
+    return model
@@ -0,0 +1,314 @@
+"""
+kb_scan.py - Knowledge base file discovery for Beep-Boop
+
+This module provides the shared YAML discovery and parsing used by the RAG
+drivers and the application entry points, so the data tree is walked in one place.
+
+File: modules/kb_scan.py
+Purpose: Concurrent discovery and parsing of YAML knowledge files
+Related: SimpleDriver, ChromaDriver, app.py, cypherpunk_app.py
+Tags: discovery, yaml, knowledge-base, startup
+"""
+
+import os
+import json
+import mmap
+import queue
+import hashlib
+import threading
+import logging
+import multiprocessing
+import yaml
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# libyaml's C loader is several times faster; fall back to pure Python without it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Suffixes treated as knowledge files, as a tuple for a single str.endswith call
+YAML_EXTENSIONS = ('.yaml', '.yml')
+
+# Persistent discovery index used by the RAG drivers, next to their embedding caches
+YAML_INDEX_FILE = "./.yaml_index.json"
+
+# Smaller files are read in one call; mapping them costs more than it saves
+MMAP_MIN_SIZE = 4096
+
+# Below this many files, process start-up costs more than parsing saves
+PARALLEL_PARSE_MIN_FILES = 32
+
+
+def discover_yaml_files(data_dir: str = "data", max_workers: int = 8,
+                        index_file: Optional[str] = None) -> List[str]:
+    """
+    Find all YAML files under a directory tree.
+
+    With ``index_file``, results are saved with the mtime of every directory
+    walked, and a later call or launch reuses them after one stat per
+    directory, rescanning if any directory changed. Without it the tree is
+    scanned on every call.
+
+    Args:
+        data_dir: Root directory to scan
+        max_workers: Number of scanning threads (1 walks inline with os.fwalk)
+        index_file: Optional JSON file for the persistent discovery index
+
+    Returns:
+        Sorted list of YAML file paths
+    """
+    if not os.path.isdir(data_dir):
+        return []
+
+    abs_dir = os.path.abspath(data_dir)
+    if index_file:
+        indexed = _read_index(index_file, data_dir, abs_dir)
+        if indexed is not None:
+            return indexed
+
+    files, dir_mtimes = _scan_yaml_files(data_dir, max_workers)
+    if index_file:
+        _write_index(index_file, data_dir, abs_dir, files, dir_mtimes)
+    return list(files)
+
+
+def _read_index(index_file: str, data_dir: str, abs_dir: str) -> Optional[List[str]]:
+    """Return indexed paths for data_dir if no directory under it has changed."""
+    try:
+        with open(index_file, 'r', encoding='utf-8') as f:
+            entry = json.load(f).get(data_dir)
+    except (OSError, ValueError, AttributeError):
+        return None
+    if not entry or entry.get('abs_dir') != abs_dir:
+        return None
+
+    for directory, mtime_ns in entry['dirs'].items():
+        try:
+            if os.stat(directory).st_mtime_ns != mtime_ns:
+                return None
+        except OSError:
+            return None
+    return list(entry['files'])
+
+
+def _write_index(index_file: str, data_dir: str, abs_dir: str,
+                 files: Tuple[str, ...], dir_mtimes: Tuple[Tuple[str, int], ...]) -> None:
+    """Record a scan in the persistent index, replacing the file atomically."""
+    try:
+        with open(index_file, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if not isinstance(index, dict):
+            index = {}
+    except (OSError, ValueError):
+        index = {}
+
+    index[data_dir] = {'abs_dir': abs_dir, 'dirs': dict(dir_mtimes), 'files': list(files)}
+    tmp_file = f"{index_file}.tmp"
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(tmp_file, index_file)
+    except OSError as e:
+        logger.warning(f"Could not write discovery index {index_file}: {e}")
+
+
+def _scan_yaml_files(data_dir: str, max_workers: int) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, int], ...]]:
+    """
+    Walk a directory tree for YAML files with a pool of scanning threads.
+
+    Directories are fed through a shared queue to the workers, so several
+    ``os.scandir`` calls can be in flight at once on slow or network-mounted
+    volumes. Entries are classified as ``os.walk`` does, so every
+    ``max_workers`` finds the same files: hidden entries are skipped,
+    symlinks to files are listed like regular files, and symlinked
+    directories are not descended into (unlike ``glob("**/*.yaml")``,
+    which follows them and can loop).
+
+    Returns the sorted YAML paths and the mtime of each directory walked,
+    taken before it was listed.
+    """
+    if max_workers <= 1:
+        return _walk_yaml_files(data_dir)
+
+    pending: "queue.Queue[str | None]" = queue.Queue()
+    pending.put(data_dir)
+    found: List[str] = []
+    dir_mtimes: List[Tuple[str, int]] = []
+    found_lock = threading.Lock()
+
+    def scan_worker():
+        while True:
+            directory = pending.get()
+            if directory is None:
+                pending.task_done()
+                return
+            try:
+                dir_mtime = os.stat(directory).st_mtime_ns
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.'):
+                            continue
+                        # is_dir reuses the stat info cached by scandir; only a
+                        # symlink costs a stat to see what it points to
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.put(entry.path)
+                        elif entry.name.endswith(YAML_EXTENSIONS) and not entry.is_dir():
+                            with found_lock:
+                                found.append(entry.path)
+                with found_lock:
+                    dir_mtimes.append((directory, dir_mtime))
+            except OSError as e:
+                logger.warning(f"Could not scan {directory}: {e}")
+            finally:
+                pending.task_done()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for _ in range(max_workers):
+            pool.submit(scan_worker)
+        pending.join()
+        for _ in range(max_workers):
+            pending.put(None)
+
+    return tuple(sorted(found)), tuple(sorted(dir_mtimes))
+
+
+def _walk_yaml_files(data_dir: str) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, int], ...]]:
+    """
+    Single-threaded walk, using ``os.fwalk`` where available.
+
+    ``os.fwalk`` keeps each directory open and stats entries relative to its
+    descriptor, avoiding repeated full-path resolution; platforms without it
+    (Windows) fall back to ``os.walk``. Neither descends into symlinked
+    directories, and symlinks to files are listed with the other files,
+    the same rule the threaded scan applies.
+    """
+    use_fwalk = hasattr(os, 'fwalk')
+    walk = os.fwalk(data_dir) if use_fwalk else os.walk(data_dir)
+    found = []
+    dir_mtimes = []
+    for root, dirs, files, *fd in walk:
+        dir_mtimes.append((root, os.stat(fd[0] if use_fwalk else root).st_mtime_ns))
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
+        for name in files:
+            if not name.startswith('.') and name.endswith(YAML_EXTENSIONS):
+                found.append(os.path.join(root, name))
+    return tuple(sorted(found)), tuple(sorted(dir_mtimes))
+
+
+def yaml_fingerprint(paths: List[str]) -> str:
+    """
+    Build a cache key for a set of knowledge files.
+
+    Only stat information is used, so checking whether saved embeddings are
+    still valid costs one stat per file rather than a full parse.
+
+    Args:
+        paths: File paths to include in the fingerprint
+
+    Returns:
+        Hex digest over each file's path, mtime and size
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(paths):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        digest.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def yaml_content_fingerprint(paths: List[str]) -> str:
+    """
+    Build a cache key for a set of knowledge files from their contents.
+
+    Slower than yaml_fingerprint, but stable across checkouts: a fresh clone
+    gives every file a new mtime while its bytes are unchanged. Used to
+    confirm a stat-level miss before rebuilding anything.
+
+    Args:
+        paths: File paths to include in the fingerprint
+
+    Returns:
+        Hex digest over each file's path and bytes
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(paths):
+        try:
+            with open(path, 'rb') as f:
+                content = f.read()
+        except OSError:
+            continue
+        digest.update(f"{path}\0{len(content)}\0".encode('utf-8'))
+        digest.update(content)
+    return digest.hexdigest()
+
+
+def load_yaml_file(path: str) -> Any:
+    """
+    Parse one YAML file with the fastest available safe loader.
+
+    Small files are read in a single call; larger ones are memory-mapped so
+    the parser reads straight from the page cache. Either way libyaml gets
+    raw bytes and detects the encoding, so no text-mode decoding layer is
+    involved.
+
+    Args:
+        path: YAML file path
+
+    Returns:
+        Parsed YAML data
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+            return yaml.load(f.read(), Loader=YamlLoader)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return yaml.load(mapped, Loader=YamlLoader)
+
+
+def _load_yaml(path: str) -> Tuple[Any, Optional[str]]:
+    """Parse one YAML file, returning (data, error) so failures survive pickling."""
+    try:
+        return load_yaml_file(path), None
+    except Exception as e:
+        return None, str(e)
+
+
+def parse_yaml_files(paths: List[str], max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Parse a set of YAML files, fanning out to worker processes for large sets.
+
+    PyYAML parsing is CPU-bound and holds the GIL, so threads do not help;
+    a spawn-context process pool is used once there are enough files to
+    pay for worker start-up.
+
+    Args:
+        paths: YAML file paths to parse
+        max_workers: Process count (defaults to the CPU count)
+
+    Returns:
+        Mapping of path to parsed data; files that failed to parse are omitted
+    """
+    results = None
+    if len(paths) >= PARALLEL_PARSE_MIN_FILES:
+        workers = max_workers or os.cpu_count() or 1
+        context = multiprocessing.get_context('spawn')
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                results = list(pool.map(_load_yaml, paths, chunksize=4))
+        except Exception as e:
+            logger.warning(f"Parallel YAML parsing failed ({e}), parsing sequentially")
+    if results is None:
+        results = [_load_yaml(path) for path in paths]
+
+    parsed = {}
+    for path, (data, error) in zip(paths, results):
+        if error is not None:
+            logger.warning(f"Error parsing {path}: {error}")
+            continue
+        parsed[path] = data
+    return parsed
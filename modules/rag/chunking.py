@@ -0,0 +1,183 @@
+"""
+chunking.py - YAML chunking and chunk size policy for RAG backends
+
+Cuts parsed YAML files into per-key chunks for the backends, then evens out
+their size: runs of tiny sibling chunks are merged and very long chunks are
+split on sentence boundaries, so most chunks land near the size retrieval
+works best at.
+"""
+
+import re
+from collections import Counter
+from typing import Any, Dict, Iterator, List
+
+from .subjects import infer_subject
+
+# Chunks are grown towards this many tokens and split above MAX_TOKENS
+TARGET_TOKENS = 64
+MAX_TOKENS = 128
+
+# Rough English average; avoids a tokenizer dependency for a size estimate
+CHARS_PER_TOKEN = 4
+
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+# Fallback break points for list-style text with few sentence ends
+_CLAUSE_END = re.compile(r'(?<=[;|,])\s+')
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of text."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+def _merge(group: List[Dict]) -> Dict:
+    """Combine consecutive chunks of one section into a single chunk."""
+    if len(group) == 1:
+        return group[0]
+    metadata = dict(group[0]["metadata"])
+    keys = [chunk["metadata"].get("key", "") for chunk in group]
+    if any(keys):
+        metadata["key"] = ", ".join(key for key in keys if key)
+    # Majority subject; ties go to the earliest chunk
+    metadata["subject"] = Counter(chunk["metadata"]["subject"] for chunk in group).most_common(1)[0][0]
+    content_types = {chunk["metadata"].get("content_type") for chunk in group}
+    if len(content_types) > 1:
+        metadata["content_type"] = "mixed"
+    return {
+        "id": group[0]["id"],
+        "text": "\n".join(chunk["text"] for chunk in group),
+        "metadata": metadata
+    }
+
+
+def _sentences(text: str) -> Iterator[str]:
+    """Sentences of text, with overlong ones broken further at list separators."""
+    for sentence in _SENTENCE_END.split(text):
+        if estimate_tokens(sentence) > MAX_TOKENS:
+            yield from _CLAUSE_END.split(sentence)
+        else:
+            yield sentence
+
+
+def _split(chunk: Dict) -> List[Dict]:
+    """Split a long chunk into sentence windows of about TARGET_TOKENS each."""
+    text = chunk["text"]
+    # Continuation pieces repeat the "section - key: " header so they stay attributable
+    header = text[:text.index(": ") + 2] if ": " in text else ""
+    pieces = []
+    window: List[str] = []
+    # Length of " ".join(window), so the estimate covers the header and separators
+    chars = 0
+    for sentence in _sentences(text):
+        if window and (chars + 1 + len(sentence)) // CHARS_PER_TOKEN > TARGET_TOKENS:
+            pieces.append(" ".join(window))
+            window, chars = [], 0
+        if not window and pieces:
+            sentence = header + sentence
+        chars += len(sentence) + (1 if window else 0)
+        window.append(sentence)
+    if window:
+        pieces.append(" ".join(window))
+    return [{"id": chunk["id"], "text": piece, "metadata": dict(chunk["metadata"])} for piece in pieces]
+
+
+def normalize_chunk_sizes(chunks: List[Dict], start_id: int = 0) -> List[Dict]:
+    """
+    Merge tiny chunks and split oversized ones.
+
+    Consecutive chunks from the same section are merged while their combined
+    estimated size stays within TARGET_TOKENS; the merged chunk lists every
+    key and takes the majority subject. Chunks estimated above MAX_TOKENS
+    are split between sentences. Ids are renumbered ``chunk_{n}`` from
+    ``start_id`` afterwards.
+
+    Args:
+        chunks: Chunks as built by a backend's chunk_yaml_data, in file order
+        start_id: First chunk number to assign
+
+    Returns:
+        Resized chunks
+    """
+    resized: List[Dict] = []
+    group: List[Dict] = []
+    group_tokens = 0
+    for chunk in chunks:
+        tokens = estimate_tokens(chunk["text"])
+        if tokens > MAX_TOKENS:
+            if group:
+                resized.append(_merge(group))
+                group, group_tokens = [], 0
+            resized.extend(_split(chunk))
+            continue
+        if group and (group_tokens + tokens > TARGET_TOKENS
+                      or chunk["metadata"].get("section") != group[0]["metadata"].get("section")):
+            resized.append(_merge(group))
+            group, group_tokens = [], 0
+        group.append(chunk)
+        group_tokens += tokens
+    if group:
+        resized.append(_merge(group))
+
+    for number, chunk in enumerate(resized, start_id):
+        chunk["id"] = f"chunk_{number}"
+    return resized
+
+
+def chunk_yaml_sections(data: Dict[str, Any], source: str, start_id: int = 0) -> List[Dict]:
+    """
+    Cut a parsed YAML mapping into one chunk per section key, then resize them.
+
+    A section holding a mapping yields a "section - key: value" chunk per
+    key (lists joined with commas); any other section yields a single
+    "section: value" chunk.
+
+    Args:
+        data: Parsed YAML file
+        source: Path recorded as each chunk's source
+        start_id: First chunk number to assign
+
+    Returns:
+        Chunks with id, text and metadata, after normalize_chunk_sizes
+    """
+    chunks = []
+    chunk_id = start_id
+    
+    for section, content in data.items():
+        if isinstance(content, dict):
+            for key, value in content.items():
+                if isinstance(value, list):
+                    chunk_text = f"{section} - {key}: {', '.join(value)}"
+                else:
+                    chunk_text = f"{section} - {key}: {value}"
+                
+                chunks.append({
+                    "id": f"chunk_{chunk_id}",
+                    "text": chunk_text,
+                    "metadata": {
+                        "section": section,
+                        "key": key,
+                        "source": source,
+                        "type": "yaml_chunk",
+                        "subject": infer_subject(chunk_text),
+                        "content_type": "list" if isinstance(value, list) else "text"
+                    }
+                })
+                chunk_id += 1
+        else:
+            chunk_text = f"{section}: {content}"
+            chunks.append({
+                "id": f"chunk_{chunk_id}",
+                "text": chunk_text,
+                "metadata": {
+                    "section": section,
+                    "source": source,
+                    "type": "yaml_chunk",
+                    "subject": infer_subject(chunk_text),
+                    "content_type": "text"
+                }
+            })
+            chunk_id += 1
+    
+    # Merge tiny sibling chunks and split oversized ones
+    return normalize_chunk_sizes(chunks, start_id)
@@ -6,11 +6,60 @@ ChromaDB backend for local development with full vector search capabilities.
 
 import chromadb
 from chromadb.config import Settings
-import yaml
 import os
-from typing import List, Dict, Optional
-from sentence_transformers import SentenceTransformer
+import json
+from typing import Any, List, Dict, Optional
+from ..embedding_models import get_embedding_model
 from .rag_adapter import RAGBackend
+from ..kb_scan import load_yaml_file, parse_yaml_files
+from .chunking import normalize_chunk_sizes
+from .subjects import infer_subject
+
+# Chunks per add_documents call when importing several files
+ADD_BATCH_SIZE = 512
+
+
+def _mapping_parts(mapping: Dict) -> List[str]:
+    """Render the scalar, string-list and one-level nested entries of a mapping as "key: value" parts."""
+    parts = []
+    for k, v in mapping.items():
+        if isinstance(v, str):
+            parts.append(f"{k}: {v}")
+        elif isinstance(v, list) and all(isinstance(x, str) for x in v):
+            parts.append(f"{k}: {', '.join(v)}")
+        elif isinstance(v, (int, float)):
+            parts.append(f"{k}: {v}")
+        elif isinstance(v, dict):
+            # Handle nested dictionaries
+            nested = [f"{nk}: {nv}" for nk, nv in v.items() if isinstance(nv, (str, int, float))]
+            if nested:
+                parts.append(f"{k}: {'; '.join(nested)}")
+    return parts
+
+
+def _value_to_text(value: Any) -> str:
+    """
+    Convert a YAML value to chunk text.
+
+    Defined at module level rather than as a closure inside chunk_yaml_data,
+    so it is not rebuilt for every file.
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        # Handle list of strings
+        if all(isinstance(item, str) for item in value):
+            return ', '.join(value)
+        # Handle list of dictionaries
+        if all(isinstance(item, dict) for item in value):
+            texts = ['; '.join(parts) for parts in map(_mapping_parts, value) if parts]
+            return ' | '.join(texts) if texts else str(value)
+        # Mixed list - convert all items to strings
+        return ', '.join(map(str, value))
+    if isinstance(value, dict):
+        parts = _mapping_parts(value)
+        return '; '.join(parts) if parts else str(value)
+    return str(value)
 
 class ChromaDBBackend(RAGBackend):
     """ChromaDB backend implementation for local development."""
@@ -18,7 +67,8 @@ class ChromaDBBackend(RAGBackend):
     def __init__(self, 
                  collection_name: str = "agentic_companion",
                  persist_directory: str = "./chroma_db",
-                 embedding_model: str = "all-MiniLM-L6-v2"):
+                 embedding_model: str = "all-MiniLM-L6-v2",
+                 manifest_file: Optional[str] = None):
         """
         Initialize the ChromaDB backend.
         
@@ -26,10 +76,14 @@ class ChromaDBBackend(RAGBackend):
             collection_name: Name of the ChromaDB collection
             persist_directory: Directory to persist ChromaDB data
             embedding_model: Sentence transformer model to use
+            manifest_file: JSON record of imported files, used to skip unchanged ones
+                (defaults to .import_manifest.json inside persist_directory)
         """
         self.collection_name = collection_name
         self.persist_directory = persist_directory
         self.embedding_model_name = embedding_model
+        # Kept beside the collections it describes, so stores never share a manifest
+        self.manifest_file = manifest_file or os.path.join(persist_directory, ".import_manifest.json")
         self.client = None
         self.collection = None
         self.embedding_model = None
@@ -43,7 +97,7 @@ class ChromaDBBackend(RAGBackend):
             
             # Initialize embedding model
             print(f"🔄 Loading embedding model: {self.embedding_model_name}")
-            self.embedding_model = SentenceTransformer(self.embedding_model_name)
+            self.embedding_model = get_embedding_model(self.embedding_model_name)
             
             # Get or create collection
             try:
@@ -63,74 +117,19 @@ class ChromaDBBackend(RAGBackend):
             print(f"❌ Failed to initialize ChromaDB: {e}")
             return False
     
-    def chunk_yaml_data(self, yaml_file: str) -> List[Dict]:
-        """Chunk YAML data into searchable documents with enhanced metadata."""
+    def chunk_yaml_data(self, yaml_file: str, data: Any = None, start_id: int = 0) -> List[Dict]:
+        """
+        Chunk YAML data into searchable documents with enhanced metadata.
+
+        Pass ``data`` when the file has already been parsed to skip loading it
+        again, and ``start_id`` to continue chunk numbering across files.
+        """
         try:
-            with open(yaml_file, 'r') as f:
-                data = yaml.safe_load(f)
+            if data is None:
+                data = load_yaml_file(yaml_file)
             
             chunks = []
-            chunk_id = 0
-            
-            def process_value(value, section, key):
-                """Process a value and convert it to text."""
-                if isinstance(value, str):
-                    return value
-                elif isinstance(value, list):
-                    # Handle list of strings
-                    if all(isinstance(item, str) for item in value):
-                        return ', '.join(value)
-                    # Handle list of dictionaries
-                    elif all(isinstance(item, dict) for item in value):
-                        texts = []
-                        for item in value:
-                            if isinstance(item, dict):
-                                item_texts = []
-                                for k, v in item.items():
-                                    if isinstance(v, str):
-                                        item_texts.append(f"{k}: {v}")
-                                    elif isinstance(v, list) and all(isinstance(x, str) for x in v):
-                                        item_texts.append(f"{k}: {', '.join(v)}")
-                                    elif isinstance(v, (int, float)):
-                                        item_texts.append(f"{k}: {v}")
-                                    elif isinstance(v, dict):
-                                        # Handle nested dictionaries
-                                        nested_texts = []
-                                        for nk, nv in v.items():
-                                            if isinstance(nv, str):
-                                                nested_texts.append(f"{nk}: {nv}")
-                                            elif isinstance(nv, (int, float)):
-                                                nested_texts.append(f"{nk}: {nv}")
-                                        if nested_texts:
-                                            item_texts.append(f"{k}: {'; '.join(nested_texts)}")
-                                if item_texts:
-                                    texts.append('; '.join(item_texts))
-                        return ' | '.join(texts) if texts else str(value)
-                    # Mixed list - convert all items to strings
-                    else:
-                        return ', '.join([str(item) for item in value])
-                elif isinstance(value, dict):
-                    texts = []
-                    for k, v in value.items():
-                        if isinstance(v, str):
-                            texts.append(f"{k}: {v}")
-                        elif isinstance(v, list) and all(isinstance(x, str) for x in v):
-                            texts.append(f"{k}: {', '.join(v)}")
-                        elif isinstance(v, (int, float)):
-                            texts.append(f"{k}: {v}")
-                        elif isinstance(v, dict):
-                            # Handle nested dictionaries
-                            nested_texts = []
-                            for nk, nv in v.items():
-                                if isinstance(nv, str):
-                                    nested_texts.append(f"{nk}: {nv}")
-                                elif isinstance(nv, (int, float)):
-                                    nested_texts.append(f"{nk}: {nv}")
-                            if nested_texts:
-                                texts.append(f"{k}: {'; '.join(nested_texts)}")
-                    return '; '.join(texts) if texts else str(value)
-                else:
-                    return str(value)
+            chunk_id = start_id
             
             for section, content in data.items():
                 if section == 'metadata':
@@ -138,7 +137,7 @@ class ChromaDBBackend(RAGBackend):
                 
                 if isinstance(content, dict):
                     for key, value in content.items():
-                        chunk_text = process_value(value, section, key)
+                        chunk_text = _value_to_text(value)
                         if chunk_text and chunk_text.strip():
                             chunks.append({
                                 "id": f"chunk_{chunk_id}",
@@ -154,7 +153,7 @@ class ChromaDBBackend(RAGBackend):
                             })
                             chunk_id += 1
                 else:
-                    chunk_text = process_value(content, section, "")
+                    chunk_text = _value_to_text(content)
                     if chunk_text and chunk_text.strip():
                         chunks.append({
                             "id": f"chunk_{chunk_id}",
@@ -169,7 +168,8 @@ class ChromaDBBackend(RAGBackend):
                         })
                         chunk_id += 1
             
-            return chunks
+            # Merge tiny sibling chunks and split oversized ones
+            return normalize_chunk_sizes(chunks, start_id)
         
         except FileNotFoundError:
             print(f"⚠️ {yaml_file} not found!")
@@ -180,41 +180,7 @@ class ChromaDBBackend(RAGBackend):
     
     def _infer_subject(self, section: str, key: str, text: str) -> str:
         """Infer the subject category from section, key, and text."""
-        text_lower = text.lower()
-        section_lower = section.lower()
-        key_lower = key.lower()
-        
-        # Subject inference logic
-        if any(word in text_lower for word in ["project", "work", "build", "create"]):
-            return "projects"
-        elif any(word in text_lower for word in ["personality", "character", "traits"]):
-            return "personality"
-        elif any(word in text_lower for word in ["value", "believe", "principle"]):
-            return "values"
-        elif any(word in text_lower for word in ["technical", "skill", "problem", "solve"]):
-            return "technical_skills"
-        elif any(word in text_lower for word in ["interest", "hobby", "passion"]):
-            return "interests"
-        elif any(word in text_lower for word in ["education", "learn", "study"]):
-            return "education"
-        elif any(word in text_lower for word in ["work", "experience", "career"]):
-            return "work_experience"
-        elif any(word in text_lower for word in ["favorite", "like", "prefer"]):
-            return "favorites"
-        elif any(word in text_lower for word in ["lifestyle", "habit", "routine"]):
-            return "lifestyle"
-        elif any(word in text_lower for word in ["family", "relationship"]):
-            return "family"
-        elif any(word in text_lower for word in ["spiritual", "spirituality"]):
-            return "spirituality"
-        elif any(word in text_lower for word in ["philosophy", "philosophical"]):
-            return "philosophy"
-        elif any(word in text_lower for word in ["dream", "aspiration", "goal"]):
-            return "dreams"
-        elif any(word in text_lower for word in ["wisdom", "insight", "knowledge"]):
-            return "wisdom"
-        else:
-            return "general"
+        return infer_subject(text)
     
     def add_documents(self, documents: List[Dict]) -> bool:
         """Add documents to the ChromaDB collection."""
@@ -322,31 +288,114 @@ class ChromaDBBackend(RAGBackend):
                 name=self.collection_name,
                 metadata={"description": "Agentic companion knowledge base"}
             )
+            self._write_manifest(None)
             print(f"✅ Cleared ChromaDB collection: {self.collection_name}")
             return True
         except Exception as e:
             print(f"❌ Error clearing ChromaDB: {e}")
             return False
     
-    def initialize_from_yaml(self, yaml_files: List[str] = None):
-        """Initialize the ChromaDB system with YAML data."""
+    def initialize_from_yaml(self, yaml_files: List[str] = None, force: bool = False):
+        """
+        Initialize the ChromaDB system with YAML data.
+
+        Files whose mtime and size match the import manifest are already in
+        the persistent collection and are skipped. Changed files have their
+        old chunks deleted before being re-imported, as do manifest files
+        that no longer exist.
+
+        Args:
+            yaml_files: YAML files to import
+            force: Re-import every file, ignoring the manifest
+        """
         
         print("🔄 Initializing ChromaDB with YAML data...")
         
-        # Process each YAML file
+        existing_files = []
         for yaml_file in yaml_files:
             if os.path.exists(yaml_file):
-                print(f"📄 Processing {yaml_file}...")
-                chunks = self.chunk_yaml_data(yaml_file)
-                if chunks:
-                    self.add_documents(chunks)
+                existing_files.append(yaml_file)
             else:
                 print(f"⚠️ {yaml_file} not found, skipping...")
+
+        # An empty collection means the stored chunks are gone, whatever the manifest says
+        manifest = self._read_manifest() if self.collection.count() else {"files": {}, "next_id": 0}
+        imported = manifest["files"]
+        signatures = {}
+        for yaml_file in existing_files:
+            stat = os.stat(yaml_file)
+            signatures[yaml_file] = [stat.st_mtime_ns, stat.st_size]
+        changed_files = [f for f in existing_files if force or imported.get(f) != signatures[f]]
+        if len(changed_files) < len(existing_files):
+            print(f"⏭️ Skipping {len(existing_files) - len(changed_files)} unchanged files")
+
+        # Drop chunks of files being replaced (including any left by a failed import)
+        # and of files deleted since they were imported
+        stale_files = list(changed_files) if self.collection.count() else []
+        stale_files += [f for f in imported if not os.path.exists(f)]
+        for yaml_file in stale_files:
+            self.collection.delete(where={"source": yaml_file})
+            imported.pop(yaml_file, None)
+
+        # Parse up front so large sets fan out to worker processes
+        parsed = parse_yaml_files(changed_files)
+
+        # Chunk every file first, numbering chunks after those already stored so ids stay unique
+        next_id = manifest["next_id"]
+        all_chunks = []
+        for yaml_file in changed_files:
+            print(f"📄 Processing {yaml_file}...")
+            all_chunks.extend(self.chunk_yaml_data(yaml_file, parsed.get(yaml_file),
+                                                   start_id=next_id + len(all_chunks)))
+
+        # Embed and store in a few large batches instead of one call per file
+        added = all([self.add_documents(all_chunks[start:start + ADD_BATCH_SIZE])
+                     for start in range(0, len(all_chunks), ADD_BATCH_SIZE)])
+        
+        if added:
+            imported.update((f, signatures[f]) for f in changed_files)
+        manifest["next_id"] = next_id + len(all_chunks)
+        self._write_manifest(manifest)
         
         # Print stats
         stats = self.get_stats()
         print(f"📊 ChromaDB stats: {stats}")
     
+    def _read_manifest(self) -> Dict:
+        """Load this collection's import manifest entry."""
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                entry = json.load(f).get(self.collection_name)
+        except (OSError, ValueError, AttributeError):
+            entry = None
+        if not isinstance(entry, dict) or not isinstance(entry.get("files"), dict):
+            return {"files": {}, "next_id": 0}
+        return {"files": entry["files"], "next_id": entry.get("next_id", 0)}
+    
+    def _write_manifest(self, entry: Optional[Dict]):
+        """Replace (or with None, remove) this collection's manifest entry atomically."""
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if not isinstance(manifest, dict):
+                manifest = {}
+        except (OSError, ValueError):
+            manifest = {}
+        
+        if entry is None:
+            if manifest.pop(self.collection_name, None) is None:
+                return
+        else:
+            manifest[self.collection_name] = entry
+        tmp_file = f"{self.manifest_file}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.manifest_file) or ".", exist_ok=True)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
+            os.replace(tmp_file, self.manifest_file)
+        except OSError as e:
+            print(f"⚠️ Could not write import manifest {self.manifest_file}: {e}")
+    
     def test_chromadb(self):
         """Test the ChromaDB backend."""
         print("🧪 Testing ChromaDB backend...")
@@ -5,12 +5,16 @@ Hugging Face Datasets backend for Spaces deployment with cloud storage.
 """
 
 import os
-import yaml
 import numpy as np
-from typing import List, Dict, Optional
-from sentence_transformers import SentenceTransformer
+from typing import Any, List, Dict, Optional
+from ..embedding_models import get_embedding_model
 from sklearn.metrics.pairwise import cosine_similarity
 from .rag_adapter import RAGBackend
+from ..kb_scan import load_yaml_file, parse_yaml_files
+from .chunking import chunk_yaml_sections
+
+# Chunks per add_documents call when importing several files
+ADD_BATCH_SIZE = 512
 
 try:
     from datasets import Dataset, load_dataset
@@ -64,7 +68,7 @@ class HuggingFaceBackend(RAGBackend):
         try:
             # Initialize embedding model
             print(f"🔄 Loading embedding model: {self.embedding_model_name}")
-            self.embedding_model = SentenceTransformer(self.embedding_model_name)
+            self.embedding_model = get_embedding_model(self.embedding_model_name)
             
             # Try to load existing dataset
             try:
@@ -96,52 +100,18 @@ class HuggingFaceBackend(RAGBackend):
         else:
             self.embeddings = np.array([])
     
-    def chunk_yaml_data(self, yaml_file: str) -> List[Dict]:
-        """Chunk YAML data into searchable documents with enhanced metadata."""
+    def chunk_yaml_data(self, yaml_file: str, data: Any = None, start_id: int = 0) -> List[Dict]:
+        """
+        Chunk YAML data into searchable documents with enhanced metadata.
+
+        Pass ``data`` when the file has already been parsed to skip loading it
+        again, and ``start_id`` to continue chunk numbering across files.
+        """
         try:
-            with open(yaml_file, 'r') as f:
-                data = yaml.safe_load(f)
-            
-            chunks = []
-            chunk_id = 0
-            
-            for section, content in data.items():
-                if isinstance(content, dict):
-                    for key, value in content.items():
-                        if isinstance(value, list):
-                            chunk_text = f"{section} - {key}: {', '.join(value)}"
-                        else:
-                            chunk_text = f"{section} - {key}: {value}"
-                        
-                        chunks.append({
-                            "id": f"chunk_{chunk_id}",
-                            "text": chunk_text,
-                            "metadata": {
-                                "section": section,
-                                "key": key,
-                                "source": yaml_file,
-                                "type": "yaml_chunk",
-                                "subject": self._infer_subject(section, key, chunk_text),
-                                "content_type": "list" if isinstance(value, list) else "text"
-                            }
-                        })
-                        chunk_id += 1
-                else:
-                    chunk_text = f"{section}: {content}"
-                    chunks.append({
-                        "id": f"chunk_{chunk_id}",
-                        "text": chunk_text,
-                        "metadata": {
-                            "section": section,
-                            "source": yaml_file,
-                            "type": "yaml_chunk",
-                            "subject": self._infer_subject(section, "", chunk_text),
-                            "content_type": "text"
-                        }
-                    })
-                    chunk_id += 1
+            if data is None:
+                data = load_yaml_file(yaml_file)
             
-            return chunks
+            return chunk_yaml_sections(data, yaml_file, start_id)
         
         except FileNotFoundError:
             print(f"⚠️ {yaml_file} not found!")
@@ -150,44 +120,6 @@ class HuggingFaceBackend(RAGBackend):
             print(f"❌ Error chunking {yaml_file}: {str(e)}")
             return []
     
-    def _infer_subject(self, section: str, key: str, text: str) -> str:
-        """Infer the subject category from section, key, and text."""
-        text_lower = text.lower()
-        section_lower = section.lower()
-        key_lower = key.lower()
-        
-        # Subject inference logic (same as ChromaDB)
-        if any(word in text_lower for word in ["project", "work", "build", "create"]):
-            return "projects"
-        elif any(word in text_lower for word in ["personality", "character", "traits"]):
-            return "personality"
-        elif any(word in text_lower for word in ["value", "believe", "principle"]):
-            return "values"
-        elif any(word in text_lower for word in ["technical", "skill", "problem", "solve"]):
-            return "technical_skills"
-        elif any(word in text_lower for word in ["interest", "hobby", "passion"]):
-            return "interests"
-        elif any(word in text_lower for word in ["education", "learn", "study"]):
-            return "education"
-        elif any(word in text_lower for word in ["work", "experience", "career"]):
-            return "work_experience"
-        elif any(word in text_lower for word in ["favorite", "like", "prefer"]):
-            return "favorites"
-        elif any(word in text_lower for word in ["lifestyle", "habit", "routine"]):
-            return "lifestyle"
-        elif any(word in text_lower for word in ["family", "relationship"]):
-            return "family"
-        elif any(word in text_lower for word in ["spiritual", "spirituality"]):
-            return "spirituality"
-        elif any(word in text_lower for word in ["philosophy", "philosophical"]):
-            return "philosophy"
-        elif any(word in text_lower for word in ["dream", "aspiration", "goal"]):
-            return "dreams"
-        elif any(word in text_lower for word in ["wisdom", "insight", "knowledge"]):
-            return "wisdom"
-        else:
-            return "general"
-    
     def add_documents(self, documents: List[Dict]) -> bool:
         """Add documents to the Hugging Face dataset."""
         if not self.initialized:
@@ -350,15 +282,26 @@ class HuggingFaceBackend(RAGBackend):
         
         print("🔄 Initializing Hugging Face backend with YAML data...")
         
-        # Process each YAML file
+        existing_files = []
         for yaml_file in yaml_files:
             if os.path.exists(yaml_file):
-                print(f"📄 Processing {yaml_file}...")
-                chunks = self.chunk_yaml_data(yaml_file)
-                if chunks:
-                    self.add_documents(chunks)
+                existing_files.append(yaml_file)
             else:
                 print(f"⚠️ {yaml_file} not found, skipping...")
+
+        # Parse up front so large sets fan out to worker processes
+        parsed = parse_yaml_files(existing_files)
+
+        # Chunk every file first, numbering chunks across files so ids stay unique
+        all_chunks = []
+        for yaml_file in existing_files:
+            print(f"📄 Processing {yaml_file}...")
+            all_chunks.extend(self.chunk_yaml_data(yaml_file, parsed.get(yaml_file),
+                                                   start_id=len(all_chunks)))
+
+        # Embed and store in a few large batches instead of one call per file
+        for start in range(0, len(all_chunks), ADD_BATCH_SIZE):
+            self.add_documents(all_chunks[start:start + ADD_BATCH_SIZE])
         
         # Save to Hub
         self.save_to_hub()
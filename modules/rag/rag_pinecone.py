@@ -6,7 +6,7 @@ Pinecone backend for production deployment with cloud vector database.
 
 import os
 from typing import List, Dict, Optional
-from sentence_transformers import SentenceTransformer
+from ..embedding_models import get_embedding_model
 from .rag_adapter import RAGBackend
 
 try:
@@ -55,7 +55,7 @@ class PineconeBackend(RAGBackend):
             
             # Initialize embedding model
             print(f"🔄 Loading embedding model: {self.embedding_model_name}")
-            self.embedding_model = SentenceTransformer(self.embedding_model_name)
+            self.embedding_model = get_embedding_model(self.embedding_model_name)
             
             # Get or create index
             if self.index_name in pinecone.list_indexes():
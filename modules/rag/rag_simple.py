@@ -6,13 +6,14 @@ No complex dependencies, works reliably on all platforms.
 """
 
 import os
-import yaml
 import numpy as np
 import pickle
 from typing import List, Dict, Optional
-from sentence_transformers import SentenceTransformer
+from ..embedding_models import get_embedding_model
 from sklearn.metrics.pairwise import cosine_similarity
 from .rag_adapter import RAGBackend
+from ..kb_scan import load_yaml_file
+from .chunking import chunk_yaml_sections
 
 class SimpleEmbeddingRAG(RAGBackend):
     """Simple embedding-based RAG using sentence transformers and numpy."""
@@ -42,7 +43,7 @@ class SimpleEmbeddingRAG(RAGBackend):
         try:
             # Load embedding model
             print(f"🔄 Loading embedding model: {self.embedding_model_name}")
-            self.embedding_model = SentenceTransformer(self.embedding_model_name)
+            self.embedding_model = get_embedding_model(self.embedding_model_name)
             
             # Try to load existing embeddings
             if os.path.exists(self.embeddings_file):
@@ -71,47 +72,9 @@ class SimpleEmbeddingRAG(RAGBackend):
             return
         
         # Load and chunk YAML data
-        with open(self.yaml_file, 'r') as f:
-            data = yaml.safe_load(f)
+        data = load_yaml_file(self.yaml_file)
         
-        self.documents = []
-        chunk_id = 0
-        
-        for section, content in data.items():
-            if isinstance(content, dict):
-                for key, value in content.items():
-                    if isinstance(value, list):
-                        chunk_text = f"{section} - {key}: {', '.join(value)}"
-                    else:
-                        chunk_text = f"{section} - {key}: {value}"
-                    
-                    self.documents.append({
-                        "id": f"chunk_{chunk_id}",
-                        "text": chunk_text,
-                        "metadata": {
-                            "section": section,
-                            "key": key,
-                            "source": self.yaml_file,
-                            "type": "yaml_chunk",
-                            "subject": self._infer_subject(section, key, chunk_text),
-                            "content_type": "list" if isinstance(value, list) else "text"
-                        }
-                    })
-                    chunk_id += 1
-            else:
-                chunk_text = f"{section}: {content}"
-                self.documents.append({
-                    "id": f"chunk_{chunk_id}",
-                    "text": chunk_text,
-                    "metadata": {
-                        "section": section,
-                        "source": self.yaml_file,
-                        "type": "yaml_chunk",
-                        "subject": self._infer_subject(section, "", chunk_text),
-                        "content_type": "text"
-                    }
-                })
-                chunk_id += 1
+        self.documents = chunk_yaml_sections(data, self.yaml_file)
         
         # Generate embeddings
         print(f"🔄 Generating embeddings for {len(self.documents)} documents...")
@@ -122,44 +85,6 @@ class SimpleEmbeddingRAG(RAGBackend):
         self._save_embeddings()
         print(f"✅ Created and saved embeddings for {len(self.documents)} documents")
     
-    def _infer_subject(self, section: str, key: str, text: str) -> str:
-        """Infer the subject category from section, key, and text."""
-        text_lower = text.lower()
-        section_lower = section.lower()
-        key_lower = key.lower()
-        
-        # Subject inference logic
-        if any(word in text_lower for word in ["project", "work", "build", "create"]):
-            return "projects"
-        elif any(word in text_lower for word in ["personality", "character", "traits"]):
-            return "personality"
-        elif any(word in text_lower for word in ["value", "believe", "principle"]):
-            return "values"
-        elif any(word in text_lower for word in ["technical", "skill", "problem", "solve"]):
-            return "technical_skills"
-        elif any(word in text_lower for word in ["interest", "hobby", "passion"]):
-            return "interests"
-        elif any(word in text_lower for word in ["education", "learn", "study"]):
-            return "education"
-        elif any(word in text_lower for word in ["work", "experience", "career"]):
-            return "work_experience"
-        elif any(word in text_lower for word in ["favorite", "like", "prefer"]):
-            return "favorites"
-        elif any(word in text_lower for word in ["lifestyle", "habit", "routine"]):
-            return "lifestyle"
-        elif any(word in text_lower for word in ["family", "relationship"]):
-            return "family"
-        elif any(word in text_lower for word in ["spiritual", "spirituality"]):
-            return "spirituality"
-        elif any(word in text_lower for word in ["philosophy", "philosophical"]):
-            return "philosophy"
-        elif any(word in text_lower for word in ["dream", "aspiration", "goal"]):
-            return "dreams"
-        elif any(word in text_lower for word in ["wisdom", "insight", "knowledge"]):
-            return "wisdom"
-        else:
-            return "general"
-    
     def _save_embeddings(self):
         """Save embeddings to file."""
         data = {
@@ -0,0 +1,97 @@
+"""
+subjects.py - Subject inference for RAG chunks
+
+Assigns each knowledge chunk a subject label from the keywords in its text,
+shared by the ChromaDB, Hugging Face, enhanced and simple backends.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Tuple
+
+# Optional C automaton; the compiled regex below is used without it
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Subjects in priority order: the first whose keywords occur in the text wins
+SUBJECT_RULES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("projects", ("project", "work", "build", "create")),
+    ("personality", ("personality", "character", "traits")),
+    ("values", ("value", "believe", "principle")),
+    ("technical_skills", ("technical", "skill", "problem", "solve")),
+    ("interests", ("interest", "hobby", "passion")),
+    ("education", ("education", "learn", "study")),
+    ("work_experience", ("work", "experience", "career")),
+    ("favorites", ("favorite", "like", "prefer")),
+    ("lifestyle", ("lifestyle", "habit", "routine")),
+    ("family", ("family", "relationship")),
+    ("spirituality", ("spiritual", "spirituality")),
+    ("philosophy", ("philosophy", "philosophical")),
+    ("dreams", ("dream", "aspiration", "goal")),
+    ("wisdom", ("wisdom", "insight", "knowledge")),
+)
+
+DEFAULT_SUBJECT = "general"
+
+_SUBJECTS = tuple(subject for subject, _ in SUBJECT_RULES)
+
+
+def _keyword_ranks() -> Dict[str, int]:
+    """Best (lowest) rule index for each keyword, also crediting keywords that are its prefixes."""
+    ranks: Dict[str, int] = {}
+    for rank, (_, keywords) in enumerate(SUBJECT_RULES):
+        for keyword in keywords:
+            ranks.setdefault(keyword, rank)
+    # The regex reports only the longest keyword starting at each position,
+    # so a match must also stand for any shorter keyword it begins with
+    return {
+        keyword: min(rank for other, rank in ranks.items() if keyword.startswith(other))
+        for keyword in ranks
+    }
+
+
+_KEYWORD_RANKS = _keyword_ranks()
+
+if ahocorasick is not None:
+    _AUTOMATON = ahocorasick.Automaton()
+    for _keyword, _rank in _KEYWORD_RANKS.items():
+        _AUTOMATON.add_word(_keyword, _rank)
+    _AUTOMATON.make_automaton()
+    _PATTERN = None
+else:
+    _AUTOMATON = None
+    _PATTERN = re.compile('(?=(' + '|'.join(
+        map(re.escape, sorted(_KEYWORD_RANKS, key=len, reverse=True))) + '))')
+
+
+@lru_cache(maxsize=4096)
+def infer_subject(text: str) -> str:
+    """
+    Infer the subject category of a chunk from its text.
+
+    Equivalent to testing each rule's keywords as substrings of the
+    lowercased text in priority order, but done in a single scan: every
+    keyword occurrence (overlapping ones included) is found in one pass and
+    the highest-priority subject among them is returned. Results are
+    memoized on the text, since re-chunking the same files repeats them.
+
+    Args:
+        text: Chunk text
+
+    Returns:
+        Subject label, or ``DEFAULT_SUBJECT`` when no keyword occurs
+    """
+    text_lower = text.lower()
+    best = len(_SUBJECTS)
+    if _AUTOMATON is not None:
+        matches = (rank for _, rank in _AUTOMATON.iter(text_lower))
+    else:
+        matches = (_KEYWORD_RANKS[match.group(1)] for match in _PATTERN.finditer(text_lower))
+    for rank in matches:
+        if rank < best:
+            best = rank
+            if best == 0:
+                break
+    return _SUBJECTS[best] if best < len(_SUBJECTS) else DEFAULT_SUBJECT
@@ -0,0 +1,101 @@
+"""
+test_chunking.py - Chunk size policy for the RAG backends
+
+Covers where normalize_chunk_sizes merges and splits chunks, and the
+metadata the merged and split chunks carry.
+"""
+
+from modules.rag.chunking import (
+    CHARS_PER_TOKEN,
+    MAX_TOKENS,
+    TARGET_TOKENS,
+    estimate_tokens,
+    normalize_chunk_sizes,
+)
+
+
+def make_chunk(text, section="about", key="k", subject="general", content_type="text"):
+    """Build a chunk shaped like chunk_yaml_sections output."""
+    return {
+        "id": "chunk_x",
+        "text": text,
+        "metadata": {
+            "section": section,
+            "key": key,
+            "source": "data/test.yaml",
+            "type": "yaml_chunk",
+            "subject": subject,
+            "content_type": content_type,
+        },
+    }
+
+
+def sized_text(tokens):
+    """Text estimated at exactly the given number of tokens."""
+    return "x" * (tokens * CHARS_PER_TOKEN)
+
+
+def test_small_siblings_merge_with_majority_subject():
+    chunks = [
+        make_chunk("about - a: one", key="a", subject="education"),
+        make_chunk("about - b: two", key="b", subject="interests", content_type="list"),
+        make_chunk("about - c: three", key="c", subject="education"),
+    ]
+
+    merged = normalize_chunk_sizes(chunks, start_id=5)
+
+    assert len(merged) == 1
+    assert merged[0]["id"] == "chunk_5"
+    assert merged[0]["text"] == "about - a: one\nabout - b: two\nabout - c: three"
+    assert merged[0]["metadata"]["key"] == "a, b, c"
+    assert merged[0]["metadata"]["subject"] == "education"
+    assert merged[0]["metadata"]["content_type"] == "mixed"
+
+
+def test_subject_tie_goes_to_earliest_chunk():
+    chunks = [
+        make_chunk("about - a: one", key="a", subject="values"),
+        make_chunk("about - b: two", key="b", subject="family"),
+    ]
+
+    assert normalize_chunk_sizes(chunks)[0]["metadata"]["subject"] == "values"
+
+
+def test_merge_stops_at_target_and_section_boundaries():
+    third = TARGET_TOKENS // 3 + 1
+    chunks = [
+        make_chunk(sized_text(third), key="a"),
+        make_chunk(sized_text(third), key="b"),
+        make_chunk(sized_text(third), key="c"),
+        make_chunk(sized_text(1), section="other", key="d"),
+    ]
+
+    resized = normalize_chunk_sizes(chunks)
+
+    assert [chunk["metadata"]["key"] for chunk in resized] == ["a, b", "c", "d"]
+    assert [chunk["id"] for chunk in resized] == ["chunk_0", "chunk_1", "chunk_2"]
+
+
+def test_long_chunk_splits_into_headed_windows_within_target():
+    header = "work_experience - responsibilities: "
+    # Short sentences, where separators and the header are a large share of each window
+    sentences = [f"Shipped {n}." for n in range(100)]
+    text = header + " ".join(sentences)
+    assert estimate_tokens(text) > MAX_TOKENS
+
+    pieces = normalize_chunk_sizes([make_chunk(text, section="work_experience", subject="projects")])
+
+    assert len(pieces) > 1
+    for piece in pieces:
+        assert piece["text"].startswith(header)
+        assert estimate_tokens(piece["text"]) <= TARGET_TOKENS
+        assert piece["metadata"]["subject"] == "projects"
+    # Only sentence boundaries move; dropping the repeated headers restores the text
+    rejoined = " ".join([pieces[0]["text"]] + [piece["text"][len(header):] for piece in pieces[1:]])
+    assert rejoined == text
+
+
+def test_chunk_at_max_tokens_is_not_split():
+    chunk = make_chunk(sized_text(MAX_TOKENS))
+
+    assert normalize_chunk_sizes([chunk])[0]["text"] == chunk["text"]
@@ -0,0 +1,188 @@
+"""
+test_cross_reference_integrator.py - Keyword matching and reference writes
+
+Checks the bitset keyword scan against plain ``keyword in text`` tests on
+both matcher backends, the shared-keyword connections against the per-keyword
+loops they replace, the appended cross_references against a full re-dump,
+and which files the per-file parse cache reparses.
+"""
+
+import random
+
+import pytest
+import yaml
+
+import cross_reference_integrator
+from cross_reference_integrator import (
+    CachedDataManager,
+    Connection,
+    CrossReferenceIntegrator,
+    KeywordMatcher,
+    _dump_yaml,
+)
+
+# Overlapping, prefix, repeated and empty keywords
+KEYWORDS = ("go", "golang", "lang", "an", "ang", "rust", "go", "", "c", "c++", "a")
+ALPHABET = "golangrust+c "
+
+
+def random_texts(count, seed=0):
+    rng = random.Random(seed)
+    return [''.join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 30))) for _ in range(count)]
+
+
+def expected_mask(keywords, text):
+    return sum(1 << index for index, keyword in enumerate(keywords) if keyword in text)
+
+
+@pytest.fixture(params=["regex", "ahocorasick"])
+def matcher_backend(request, monkeypatch):
+    """Run a test once on the regex fallback and once on Aho-Corasick."""
+    if request.param == "regex":
+        monkeypatch.setattr(cross_reference_integrator, "ahocorasick", None)
+    elif cross_reference_integrator.ahocorasick is None:
+        pytest.skip("pyahocorasick not installed")
+    return request.param
+
+
+@pytest.fixture
+def integrator(tmp_path):
+    return CrossReferenceIntegrator(str(tmp_path))
+
+
+def test_mask_matches_substring_tests(matcher_backend):
+    matcher = KeywordMatcher(KEYWORDS)
+
+    for text in random_texts(500) + ["", "golang", "c++ and rust"]:
+        assert matcher.mask(text) == expected_mask(KEYWORDS, text), text
+
+
+def test_mask_of_empty_family_is_zero(matcher_backend):
+    assert KeywordMatcher(()).mask("anything") == 0
+
+
+@pytest.mark.skipif(cross_reference_integrator.ahocorasick is None, reason="pyahocorasick not installed")
+def test_regex_and_aho_corasick_paths_agree(monkeypatch):
+    automaton_matcher = KeywordMatcher(KEYWORDS)
+    monkeypatch.setattr(cross_reference_integrator, "ahocorasick", None)
+    regex_matcher = KeywordMatcher(KEYWORDS)
+
+    for text in random_texts(500, seed=1):
+        assert automaton_matcher.mask(text) == regex_matcher.mask(text), text
+
+
+def test_shared_keyword_connections_match_per_keyword_loops(integrator, matcher_backend):
+    keywords = tuple(keyword for keyword in KEYWORDS if keyword)
+    source_data = {f"s{i}": {"text": text} for i, text in enumerate(random_texts(25, seed=2))}
+    target_data = {f"t{i}": [text] for i, text in enumerate(random_texts(25, seed=3))}
+    description = "'{keyword}' connects {source_file} to {target_file}"
+
+    connections = integrator._find_by_keywords(
+        source_data, target_data, "projects", "career", keywords,
+        "technical_skill", 0.95, description, detail_field="skill"
+    )
+
+    # Ordered by source file, then keyword, then target file, as the original nested loops were
+    expected = [
+        Connection("projects", source_file, "career", target_file, "technical_skill", 0.95,
+                   description.format(keyword=keyword, source_file=source_file, target_file=target_file),
+                   keyword)
+        for source_file, source_content in source_data.items()
+        for keyword in keywords if keyword in source_content["text"]
+        for target_file, target_content in target_data.items() if keyword in target_content[0]
+    ]
+    assert connections == expected
+
+
+def test_theme_connections_link_each_pair_once(integrator, matcher_backend):
+    source_data = {"a": {"text": "Freedom and liberty"}, "b": {"text": "nothing"}}
+    target_data = {"c": {"text": "sovereignty"}, "d": {"text": "novel ideas"}}
+
+    connections = integrator._find_theme_connections("freedom", source_data, target_data, "values", "projects")
+
+    assert [(c.source_file, c.target_file) for c in connections] == [("a", "c")]
+
+
+def reference(target_file, score=0.9, skill="python"):
+    return {
+        'type': 'outgoing',
+        'target_category': 'projects',
+        'target_file': target_file,
+        'connection_type': 'technical_skill',
+        'relevance_score': score,
+        'description': f"Technical skill '{skill}' connects x to {target_file}",
+        'skill': skill,
+    }
+
+
+def write_yaml(path, data):
+    with open(path, 'w', encoding='utf-8') as file:
+        _dump_yaml(data, file)
+
+
+def test_append_matches_full_rewrite(integrator, tmp_path):
+    data = {'name': 'Résumé', 'cross_references': [reference("one")]}
+    path = tmp_path / "skills.yaml"
+    write_yaml(path, data)
+    new = [reference("two"), reference("three", skill="rust")]
+
+    integrator._add_references_to_file(path, new)
+
+    rewritten = tmp_path / "rewritten.yaml"
+    write_yaml(rewritten, {**data, 'cross_references': data['cross_references'] + new})
+    assert path.read_text(encoding='utf-8') == rewritten.read_text(encoding='utf-8')
+
+
+def test_rewrite_when_references_do_not_end_the_file(integrator, tmp_path):
+    path = tmp_path / "skills.yaml"
+    write_yaml(path, {'cross_references': [reference("one")], 'name': 'x'})
+
+    integrator._add_references_to_file(path, [reference("two")])
+
+    data = yaml.safe_load(path.read_text(encoding='utf-8'))
+    assert data == {'cross_references': [reference("one"), reference("two")], 'name': 'x'}
+
+
+def test_rerun_updates_instead_of_duplicating(integrator, tmp_path):
+    path = tmp_path / "skills.yaml"
+    write_yaml(path, {'name': 'x', 'cross_references': [reference("one", score=0.5), reference("one", score=0.7)]})
+
+    integrator._add_references_to_file(path, [reference("one", score=0.6), reference("two")])
+
+    data = yaml.safe_load(path.read_text(encoding='utf-8'))
+    assert data['cross_references'] == [reference("one", score=0.7), reference("two")]
+
+
+def test_parse_cache_is_reused_and_only_written_files_are_reparsed(tmp_path, monkeypatch):
+    personal = tmp_path / "personal"
+    personal.mkdir()
+    write_yaml(personal / "values.yaml", {'core_values': [{'value': 'Honesty'}]})
+    write_yaml(personal / "goals.yaml", {'goals': ['ship']})
+    first = CrossReferenceIntegrator(str(tmp_path))
+    assert (tmp_path / ".parse_cache.pkl").exists()
+
+    parsed = []
+    load = cross_reference_integrator.DataManager._load_yaml_file
+    monkeypatch.setattr(cross_reference_integrator.DataManager, "_load_yaml_file",
+                        lambda self, file_path: parsed.append(file_path.name) or load(self, file_path))
+
+    CrossReferenceIntegrator(str(tmp_path))
+    assert parsed == []
+
+    first._add_references_to_file(personal / "values.yaml", [reference("one")])
+    first.data_manager.save()
+    second = CrossReferenceIntegrator(str(tmp_path))
+    assert parsed == ["values.yaml"]
+    assert second.data_manager.get_file('personal', 'values')['cross_references'] == [reference("one")]
+    assert second.data_manager.get_file('personal', 'goals') == {'goals': ['ship']}
+
+
+def test_unreadable_parse_cache_is_ignored(tmp_path):
+    (tmp_path / "personal").mkdir()
+    write_yaml(tmp_path / "personal" / "goals.yaml", {'goals': ['ship']})
+    with open(tmp_path / ".parse_cache.pkl", 'wb') as file:
+        file.write(b"not a pickle")
+
+    manager = CachedDataManager(str(tmp_path))
+
+    assert manager.get_file('personal', 'goals') == {'goals': ['ship']}
@@ -0,0 +1,43 @@
+"""
+test_kb_scan.py - YAML discovery
+
+Checks that the threaded scan and the single-threaded walk apply the same
+rules to hidden entries and symlinks.
+"""
+
+import os
+
+import pytest
+
+from modules.kb_scan import discover_yaml_files
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    root = tmp_path / "data"
+    (root / "sub").mkdir(parents=True)
+    (root / ".hidden").mkdir()
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (root / "top.yaml").write_text("a: 1\n")
+    (root / "sub" / "nested.yml").write_text("b: 1\n")
+    (root / ".hidden" / "skipped.yaml").write_text("c: 1\n")
+    (root / ".dotfile.yaml").write_text("d: 1\n")
+    (outside / "shared.yaml").write_text("e: 1\n")
+    try:
+        os.symlink(outside / "shared.yaml", root / "linked.yaml")
+        os.symlink(outside, root / "linked_dir")
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported")
+    return root
+
+
+@pytest.mark.parametrize("max_workers", [1, 8])
+def test_file_symlinks_are_listed_and_directory_symlinks_are_not_followed(data_dir, max_workers):
+    found = discover_yaml_files(str(data_dir), max_workers=max_workers)
+
+    assert found == [
+        str(data_dir / "linked.yaml"),
+        str(data_dir / "sub" / "nested.yml"),
+        str(data_dir / "top.yaml"),
+    ]
@@ -0,0 +1,102 @@
+"""
+test_response_cache.py - Orchestrator response cache
+
+Covers exact and semantic hits, the previous-reply part of the key,
+least-recently-used eviction and which responses are kept out of the cache.
+"""
+
+import asyncio
+
+from modules.core.response_cache import SemanticResponseCache
+
+VECTORS = {
+    "what do you build?": [1.0, 0.0, 0.0],
+    "what do you create?": [0.99, 0.1, 0.0],
+    "what is your favorite movie?": [0.0, 1.0, 0.0],
+}
+
+
+def response(text, confidence=0.9, **metadata):
+    """Build a response dict shaped like the orchestrator's final response."""
+    return {
+        "response": text,
+        "metadata": {"confidence": confidence, **metadata},
+        "usage": {"total_tokens": 10},
+    }
+
+
+def turn(user_input, assistant_response):
+    """Build a conversation turn as returned by get_conversation_context."""
+    return {"type": "conversation_turn", "user_input": user_input,
+            "assistant_response": assistant_response, "timestamp": "2024-01-01T00:00:00"}
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_exact_hit_ignores_case_and_whitespace():
+    cache = SemanticResponseCache()
+    run(cache.put("What do you build?", response("Tools.")))
+
+    hit = run(cache.get("  what do  you BUILD? "))
+
+    assert hit["response"] == "Tools."
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_identity_and_voice_mode_are_part_of_the_key():
+    cache = SemanticResponseCache()
+    run(cache.put("hello", response("Hi."), identity="Stephen"))
+
+    assert run(cache.get("hello", identity="Tibocin")) is None
+    assert run(cache.get("hello", identity="Stephen", voice_mode=True)) is None
+    assert run(cache.get("hello", identity="Stephen")) is not None
+
+
+def test_follow_up_is_keyed_on_the_previous_reply_only():
+    cache = SemanticResponseCache()
+    history = [turn("hi", "Hello!"), turn("what do you build?", "Tools for sovereignty.")]
+    run(cache.put("tell me more", response("More about tools."), context=history))
+
+    longer_history = [turn("something else", "Sure.")] + history
+    other_reply = history[:1] + [turn("favorite movie?", "The Matrix.")]
+
+    assert run(cache.get("tell me more", context=longer_history))["response"] == "More about tools."
+    assert run(cache.get("tell me more", context=other_reply)) is None
+    assert run(cache.get("tell me more")) is None
+
+
+def test_semantic_hit_above_threshold():
+    cache = SemanticResponseCache(embed_fn=VECTORS.__getitem__, similarity_threshold=0.95)
+    run(cache.put("What do you build?", response("Tools.")))
+
+    assert run(cache.get("What do you create?"))["response"] == "Tools."
+    assert run(cache.get("What is your favorite movie?")) is None
+    assert cache.get_stats()["semantic"] is True
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SemanticResponseCache(max_entries=2)
+    run(cache.put("a", response("A")))
+    run(cache.put("b", response("B")))
+    run(cache.get("a"))
+    run(cache.put("c", response("C")))
+
+    assert run(cache.get("b")) is None
+    assert run(cache.get("a"))["response"] == "A"
+    assert run(cache.get("c"))["response"] == "C"
+    assert cache.get_stats()["entries"] == 2
+
+
+def test_unevaluated_low_confidence_and_error_responses_are_not_cached():
+    cache = SemanticResponseCache(min_confidence=0.7)
+    run(cache.put("unevaluated", {"response": "x", "metadata": {}, "usage": {}}))
+    run(cache.put("low", response("x", confidence=0.5)))
+    run(cache.put("error", response("x", error=True)))
+    run(cache.put("good", response("x", confidence=0.7)))
+
+    assert run(cache.get("unevaluated")) is None
+    assert run(cache.get("low")) is None
+    assert run(cache.get("error")) is None
+    assert run(cache.get("good")) is not None